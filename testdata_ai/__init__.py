@@ -1,14 +1,16 @@
 """testdata-ai: AI-powered test data generator for QA engineers."""
 
-from importlib.metadata import version, PackageNotFoundError
+def _resolve_version() -> str:
+    """Resolve the installed version, falling back for source checkouts."""
+    from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("testdata-ai")
-except PackageNotFoundError:
-    __version__ = "0.0.0-dev"
+    try:
+        return version("testdata-ai")
+    except PackageNotFoundError:
+        return "0.0.0-dev"
 
-from testdata_ai.generator import TestDataGenerator, generate
-from testdata_ai.contexts import list_contexts, get_context_schema
+
+__version__ = _resolve_version()
 
 __all__ = [
     "TestDataGenerator",
@@ -16,3 +18,27 @@ __all__ = [
     "list_contexts",
     "get_context_schema",
 ]
+
+# PEP 562 lazy imports: `import testdata_ai` stays cheap (no generator,
+# config, or dotenv machinery) until one of the public names is touched.
+_EXPORTS = {
+    "TestDataGenerator": "testdata_ai.generator",
+    "generate": "testdata_ai.generator",
+    "list_contexts": "testdata_ai.contexts",
+    "get_context_schema": "testdata_ai.contexts",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
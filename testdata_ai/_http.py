@@ -0,0 +1,55 @@
+"""
+Shared HTTP client plumbing for async AI providers.
+
+Each SDK client normally brings up its own httpx pool, so workflows that
+construct many generators pay a fresh TLS handshake per client. A single
+process-wide ``httpx.AsyncClient`` lets all async providers reuse pooled
+connections instead.
+"""
+
+import os
+import threading
+from typing import Optional
+
+__all__ = ["get_shared_async_client"]
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_shared_async_client():
+    """Return the process-wide ``httpx.AsyncClient``, creating it on first use.
+
+    Pool limits can be tuned via the ``TESTDATA_MAX_CONN`` and
+    ``TESTDATA_MAX_KEEPALIVE_CONN`` environment variables.
+
+    Raises:
+        ImportError: If httpx is not installed (it ships with the
+            openai/anthropic SDK extras).
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+
+def _build_client():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx package is required: pip install openai or anthropic"
+        )
+    max_connections = int(os.getenv("TESTDATA_MAX_CONN", "200"))
+    max_keepalive = int(
+        os.getenv("TESTDATA_MAX_KEEPALIVE_CONN", str(max_connections // 10))
+    )
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+        ),
+        timeout=120.0,
+    )
@@ -0,0 +1,73 @@
+"""
+Retry helper for async provider calls.
+
+The SDK clients can retry on their own, but their schedule ignores the
+server's Retry-After hint in older versions and stacks poorly under
+asyncio fan-out: every blind retry burns rate-limit budget the other
+in-flight tasks need. This module owns retries for the async providers
+instead — full-jitter exponential backoff, bounded attempts, and the
+server's Retry-After honored when it asks for longer.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Optional
+
+__all__ = ["call_with_retry"]
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503})
+
+
+async def call_with_retry(coro_fn, *args, max_attempts: int = 5, **kwargs):
+    """Call an async API function, retrying transient failures.
+
+    Retries HTTP 429/500/502/503 with ``random.uniform(0, 2**attempt)``
+    full-jitter backoff, sleeping at least the server's Retry-After when
+    one is provided. Anything else propagates immediately.
+
+    Args:
+        coro_fn: Async callable to invoke (e.g., client.messages.create)
+        *args: Positional arguments forwarded to coro_fn
+        max_attempts: Total attempts before giving up
+        **kwargs: Keyword arguments forwarded to coro_fn
+
+    Returns:
+        Whatever coro_fn returns
+
+    Raises:
+        The last exception, once attempts are exhausted or the error is
+        not retryable.
+    """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+
+    for attempt in range(max_attempts):
+        try:
+            return await coro_fn(*args, **kwargs)
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            if status not in _RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+            delay = random.uniform(0, 2 ** attempt)
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            logger.warning(
+                f"API returned {status}; retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            await asyncio.sleep(delay)
+
+
+def _retry_after_seconds(exc) -> Optional[float]:
+    """Read a usable Retry-After value from an API error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
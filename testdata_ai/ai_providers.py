@@ -4,9 +4,25 @@ Supports multiple AI providers (OpenAI, Anthropic, etc.)
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+import io
+import itertools
+import json
 import logging
+import time
+from collections import deque
+from typing import List, Optional, Sequence
 
-__all__ = ["AIProvider", "get_provider", "DEFAULT_SYSTEM_PROMPT"]
+from testdata_ai._retry import call_with_retry
+
+__all__ = [
+    "AIProvider",
+    "AsyncAIProvider",
+    "RateLimiter",
+    "get_provider",
+    "get_async_provider",
+    "DEFAULT_SYSTEM_PROMPT",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +35,35 @@ DEFAULT_SYSTEM_PROMPT = (
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
-    def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        api_keys: Optional[Sequence[str]] = None,
+    ):
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self._init_client(api_key)
+        self._rr = None
+        keys = tuple(api_keys) if api_keys else (api_key,)
+        self._init_client(keys[0])
+        if len(keys) > 1:
+            # One client per key, rotated round-robin per request: aggregate
+            # RPM becomes the sum of the per-key limits.
+            clients = [self.client]
+            for key in keys[1:]:
+                self._init_client(key)
+                clients.append(self.client)
+            self.client = clients[0]
+            self._rr = itertools.cycle(clients)
+
+    def _next_client(self):
+        """Return the client for the next request, rotating across API keys."""
+        if self._rr is not None:
+            self.client = next(self._rr)
+        return self.client
 
     @abstractmethod
     def _init_client(self, api_key: str) -> None:
@@ -41,6 +81,115 @@ class AIProvider(ABC):
             Generated text response
         """
 
+    def generate_freeform(
+        self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        """Generate a response without forcing the single-array tool shape.
+
+        Used for prompts whose JSON layout differs from the standard
+        ``{"data": [...]}`` envelope (e.g. the multi-context prompt keyed
+        by context name). Providers that constrain ``generate`` to that
+        envelope override this; the default is a plain ``generate`` call.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+
+        Returns:
+            Generated text response
+        """
+        return self.generate(prompt, system_prompt)
+
+    @abstractmethod
+    def stream(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT):
+        """Stream the response from AI as it is generated.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+
+        Yields:
+            Text chunks as they arrive from the API
+        """
+
+    @abstractmethod
+    def submit_batch(
+        self, prompts: List[str], system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        """Submit prompts as one server-side batch job.
+
+        Batch endpoints cost roughly half the synchronous price and are
+        not subject to per-request RPM limits, at the expense of latency.
+
+        Args:
+            prompts: User prompts, one request per prompt
+            system_prompt: System instructions shared by all requests
+
+        Returns:
+            Provider-assigned batch id
+        """
+
+    @abstractmethod
+    def await_batch(
+        self, batch_id: str, poll_interval: float = 5.0, timeout: float = 86400.0
+    ) -> List[str]:
+        """Block until a batch job finishes and return its responses.
+
+        Polls with exponential backoff up to ``timeout`` seconds.
+
+        Args:
+            batch_id: Id returned by submit_batch
+            poll_interval: Initial seconds between status polls
+            timeout: Maximum seconds to wait before giving up
+
+        Returns:
+            Response texts in the same order as the submitted prompts
+
+        Raises:
+            RuntimeError: If the batch fails, expires, or times out
+        """
+
+
+def _batch_backoff(poll_interval: float, timeout: float, batch_id: str):
+    """Yield forever with exponentially growing sleeps, until timeout."""
+    deadline = time.monotonic() + timeout
+    delay = poll_interval
+    while True:
+        yield
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"Batch {batch_id} did not complete within {timeout:.0f}s"
+            )
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, 60.0)
+
+
+def _order_batch_results(results: dict, batch_id: str) -> List[str]:
+    """Return responses ordered by their request-N custom ids."""
+    ordered = []
+    for i in range(len(results)):
+        custom_id = f"request-{i}"
+        if custom_id not in results:
+            raise RuntimeError(f"Batch {batch_id} is missing result {custom_id}")
+        ordered.append(results[custom_id])
+    return ordered
+
+
+# Shared immutable-by-convention default system message, so the hot path
+# builds `messages` with one list literal and no appends.
+_OPENAI_SYS_MSG = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
+
+def _build_openai_messages(prompt: str, system_prompt: str) -> list:
+    if system_prompt == DEFAULT_SYSTEM_PROMPT:
+        return [_OPENAI_SYS_MSG, {"role": "user", "content": prompt}]
+    if system_prompt:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+    return [{"role": "user", "content": prompt}]
+
 
 class OpenAIProvider(AIProvider):
     """OpenAI provider (GPT-4o, etc.)"""
@@ -53,13 +202,11 @@ class OpenAIProvider(AIProvider):
         self.client = OpenAI(api_key=api_key, timeout=120.0, max_retries=3)
 
     def generate(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = _build_openai_messages(prompt, system_prompt)
 
+        client = self._next_client()
         try:
-            response = self.client.chat.completions.create(
+            response = client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -82,6 +229,111 @@ class OpenAIProvider(AIProvider):
             )
         return content
 
+    def stream(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT):
+        messages = _build_openai_messages(prompt, system_prompt)
+
+        client = self._next_client()
+        try:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            if "timed out" in str(e).lower():
+                raise RuntimeError(
+                    f"Request to OpenAI timed out ({self.model}). "
+                    f"Try reducing --count or using a faster model like gpt-4o-mini."
+                ) from e
+            raise RuntimeError(f"Failed to generate data with OpenAI: {e}") from e
+
+    def submit_batch(
+        self, prompts: List[str], system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        lines = []
+        for i, prompt in enumerate(prompts):
+            messages = _build_openai_messages(prompt, system_prompt)
+            lines.append(json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+
+        client = self._next_client()
+        try:
+            batch_file = client.files.create(
+                file=io.BytesIO("\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise RuntimeError(f"Failed to submit OpenAI batch: {e}") from e
+
+        logger.info(f"Submitted OpenAI batch {batch.id} ({len(prompts)} requests)")
+        return batch.id
+
+    def await_batch(
+        self, batch_id: str, poll_interval: float = 5.0, timeout: float = 86400.0
+    ) -> List[str]:
+        for _ in _batch_backoff(poll_interval, timeout, batch_id):
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}")
+
+        output = self.client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry.get("error"):
+                raise RuntimeError(
+                    f"OpenAI batch request {entry['custom_id']} failed: "
+                    f"{entry['error']}"
+                )
+            body = entry["response"]["body"]
+            results[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+        return _order_batch_results(results, batch_id)
+
+
+# Forces Claude to answer via a tool call whose input already is parsed
+# JSON: no markdown fences to strip, and no tokens spent on them.
+_JSON_TOOL = {
+    "name": "emit_records",
+    "description": "Emit the generated test data records.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "data": {"type": "array", "items": {"type": "object"}},
+        },
+        "required": ["data"],
+    },
+}
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic provider (Claude)."""
@@ -93,15 +345,307 @@ class AnthropicProvider(AIProvider):
             raise ImportError("anthropic package is required: pip install anthropic")
         self.client = Anthropic(api_key=api_key, timeout=120.0, max_retries=3)
 
+    def _create_message(self, prompt: str, system_prompt: str, **kwargs):
+        """Call messages.create with shared error translation."""
+        client = self._next_client()
+        try:
+            return client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                system=system_prompt,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs,
+            )
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            if "timed out" in str(e).lower():
+                raise RuntimeError(
+                    f"Request to Anthropic timed out ({self.model}). "
+                    f"Try reducing --count or using a faster model."
+                ) from e
+            raise RuntimeError(f"Failed to generate data with Anthropic: {e}") from e
+
     def generate(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
+        response = self._create_message(
+            prompt,
+            system_prompt,
+            tools=[_JSON_TOOL],
+            tool_choice={"type": "tool", "name": _JSON_TOOL["name"]},
+        )
+        if not response.content:
+            raise RuntimeError("Anthropic returned an empty response")
+        for block in response.content:
+            if getattr(block, "type", None) == "tool_use":
+                # block.input is already a parsed dict; serialize to keep
+                # the str contract with the generator's parse path.
+                return json.dumps(block.input)
+        return response.content[0].text
+
+    def generate_freeform(
+        self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        # No forced tool call: the _JSON_TOOL schema can only express the
+        # {"data": [...]} envelope, which would clobber prompts that ask
+        # for a differently keyed object (see get_multi_prompt).
+        response = self._create_message(prompt, system_prompt)
+        if not response.content:
+            raise RuntimeError("Anthropic returned an empty response")
+        return response.content[0].text
+
+    def stream(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT):
+        client = self._next_client()
         try:
-            response = self.client.messages.create(
+            with client.messages.stream(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
                 system=system_prompt,
                 messages=[{"role": "user", "content": prompt}],
+            ) as response:
+                for text in response.text_stream:
+                    yield text
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            if "timed out" in str(e).lower():
+                raise RuntimeError(
+                    f"Request to Anthropic timed out ({self.model}). "
+                    f"Try reducing --count or using a faster model."
+                ) from e
+            raise RuntimeError(f"Failed to generate data with Anthropic: {e}") from e
+
+    def submit_batch(
+        self, prompts: List[str], system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        requests = [
+            {
+                "custom_id": f"request-{i}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature,
+                    "system": system_prompt,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for i, prompt in enumerate(prompts)
+        ]
+
+        client = self._next_client()
+        try:
+            batch = client.messages.batches.create(requests=requests)
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise RuntimeError(f"Failed to submit Anthropic batch: {e}") from e
+
+        logger.info(f"Submitted Anthropic batch {batch.id} ({len(prompts)} requests)")
+        return batch.id
+
+    def await_batch(
+        self, batch_id: str, poll_interval: float = 5.0, timeout: float = 86400.0
+    ) -> List[str]:
+        for _ in _batch_backoff(poll_interval, timeout, batch_id):
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                break
+
+        results = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                raise RuntimeError(
+                    f"Anthropic batch request {entry.custom_id} "
+                    f"{entry.result.type}"
+                )
+            results[entry.custom_id] = entry.result.message.content[0].text
+        return _order_batch_results(results, batch_id)
+
+
+class RateLimiter:
+    """Bounds concurrent requests and requests-per-minute for async providers.
+
+    A naive ``asyncio.gather`` over many sub-batches overruns provider
+    RPM limits and triggers 429s, which the SDKs retry with exponential
+    backoff — far more expensive than waiting in-process. This combines
+    an ``asyncio.Semaphore`` (max in-flight requests) with a sliding
+    60-second window of request timestamps (max requests per minute).
+
+    Usage:
+        async with limiter:
+            await client.chat.completions.create(...)
+    """
+
+    def __init__(self, max_concurrency: int = 8, rpm: Optional[int] = None):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if rpm is not None and rpm < 1:
+            raise ValueError(f"rpm must be >= 1, got {rpm}")
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._timestamps: deque = deque()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._sem.acquire()
+        try:
+            await self._wait_for_rpm_slot()
+        except BaseException:
+            self._sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self._sem.release()
+
+    async def _wait_for_rpm_slot(self) -> None:
+        if self.rpm is None:
+            return
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= 60.0:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rpm:
+                    self._timestamps.append(now)
+                    return
+                wait = 60.0 - (now - self._timestamps[0])
+            logger.debug("RPM limit reached, waiting %.1fs", wait)
+            await asyncio.sleep(wait)
+
+
+class AsyncAIProvider(ABC):
+    """Abstract base class for async AI providers.
+
+    Mirrors :class:`AIProvider` but exposes an awaitable ``generate`` so
+    callers can dispatch many sub-requests concurrently. Concurrency is
+    bounded by a :class:`RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        max_concurrency: int = 8,
+        rpm: Optional[int] = None,
+        api_keys: Optional[Sequence[str]] = None,
+    ):
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.limiter = RateLimiter(max_concurrency=max_concurrency, rpm=rpm)
+        self._rr = None
+        keys = tuple(api_keys) if api_keys else (api_key,)
+        self._init_client(keys[0])
+        if len(keys) > 1:
+            clients = [self.client]
+            for key in keys[1:]:
+                self._init_client(key)
+                clients.append(self.client)
+            self.client = clients[0]
+            self._rr = itertools.cycle(clients)
+
+    def _next_client(self):
+        """Return the client for the next request, rotating across API keys."""
+        if self._rr is not None:
+            self.client = next(self._rr)
+        return self.client
+
+    @abstractmethod
+    def _init_client(self, api_key: str) -> None:
+        """Initialize the provider-specific async client."""
+
+    @abstractmethod
+    async def generate(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
+        """Generate response from AI.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+
+        Returns:
+            Generated text response
+        """
+
+
+class AsyncOpenAIProvider(AsyncAIProvider):
+    """Async OpenAI provider (GPT-4o, etc.)"""
+
+    def _init_client(self, api_key: str) -> None:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("openai package is required: pip install openai")
+        from testdata_ai._http import get_shared_async_client
+        # Retries are handled by call_with_retry (jitter + Retry-After);
+        # SDK-level retries would stack a second backoff schedule on top.
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_shared_async_client(),
+            timeout=120.0,
+            max_retries=0,
+        )
+
+    async def generate(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
+        messages = _build_openai_messages(prompt, system_prompt)
+
+        client = self._next_client()
+        try:
+            async with self.limiter:
+                response = await call_with_retry(
+                    client.chat.completions.create,
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    response_format={"type": "json_object"},
+                )
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            if "timed out" in str(e).lower():
+                raise RuntimeError(
+                    f"Request to OpenAI timed out ({self.model}). "
+                    f"Try reducing --count or using a faster model like gpt-4o-mini."
+                ) from e
+            raise RuntimeError(f"Failed to generate data with OpenAI: {e}") from e
+
+        content = response.choices[0].message.content
+        if content is None:
+            raise RuntimeError(
+                "OpenAI returned an empty response (possible content filter)"
             )
+        return content
+
+
+class AsyncAnthropicProvider(AsyncAIProvider):
+    """Async Anthropic provider (Claude)."""
+
+    def _init_client(self, api_key: str) -> None:
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError:
+            raise ImportError("anthropic package is required: pip install anthropic")
+        from testdata_ai._http import get_shared_async_client
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=get_shared_async_client(),
+            timeout=120.0,
+            max_retries=0,
+        )
+
+    async def generate(self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
+        client = self._next_client()
+        try:
+            async with self.limiter:
+                response = await call_with_retry(
+                    client.messages.create,
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": prompt}],
+                )
         except Exception as e:
             logger.error(f"Anthropic API error: {e}")
             if "timed out" in str(e).lower():
@@ -121,14 +665,35 @@ _PROVIDERS = {
     "anthropic": AnthropicProvider,
 }
 
+_ASYNC_PROVIDERS = {
+    "openai": AsyncOpenAIProvider,
+    "anthropic": AsyncAnthropicProvider,
+}
+
 
 def get_provider(
     provider_name: str, api_key: str, model: str,
     temperature: float, max_tokens: int,
+    api_keys: Optional[Sequence[str]] = None,
 ) -> AIProvider:
     """Factory function to create an AI provider instance."""
     cls = _PROVIDERS.get(provider_name)
     if cls is None:
         supported = ", ".join(_PROVIDERS)
         raise ValueError(f"Unsupported provider: '{provider_name}'. Supported: {supported}")
-    return cls(api_key, model, temperature, max_tokens)
+    return cls(api_key, model, temperature, max_tokens, api_keys=api_keys)
+
+
+def get_async_provider(
+    provider_name: str, api_key: str, model: str,
+    temperature: float, max_tokens: int,
+    max_concurrency: int = 8, rpm: Optional[int] = None,
+    api_keys: Optional[Sequence[str]] = None,
+) -> AsyncAIProvider:
+    """Factory function to create an async AI provider instance."""
+    cls = _ASYNC_PROVIDERS.get(provider_name)
+    if cls is None:
+        supported = ", ".join(_ASYNC_PROVIDERS)
+        raise ValueError(f"Unsupported provider: '{provider_name}'. Supported: {supported}")
+    return cls(api_key, model, temperature, max_tokens, max_concurrency, rpm,
+               api_keys=api_keys)
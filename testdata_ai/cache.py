@@ -0,0 +1,88 @@
+"""
+In-process cache for identical LLM requests.
+
+Repeated calls with byte-identical prompts (examples, test suites, retry
+loops) otherwise re-issue full paid API requests. An exact-match cache
+keyed on the request parameters turns those into a dict lookup. Caching
+is only safe when responses are deterministic, so it is enabled for
+temperature 0.0 and opt-in otherwise via TESTDATA_CACHE_NONDETERMINISTIC=1.
+"""
+
+__all__ = ["LLMCache", "get_response_cache", "cache_enabled"]
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class LLMCache:
+    """Exact-match LRU cache for LLM response text.
+
+    Keys are a blake2b digest of the request parameters, so byte-identical
+    prompts against the same provider/model/temperature hit the cache.
+    Thread-safe; least-recently-used entries are evicted past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        prompt: str,
+    ) -> str:
+        """Build the cache key for one request."""
+        raw = f"{provider}|{model}|{temperature}|{system_prompt}|{prompt}"
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            response = self._data.get(key)
+            if response is not None:
+                self._data.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least-recently-used entry if full."""
+        with self._lock:
+            self._data[key] = response
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cache_enabled(temperature: float) -> bool:
+    """Whether responses at this temperature should be cached.
+
+    Deterministic requests (temperature 0.0) are always cacheable;
+    anything else requires TESTDATA_CACHE_NONDETERMINISTIC=1.
+    """
+    if temperature == 0.0:
+        return True
+    return os.getenv("TESTDATA_CACHE_NONDETERMINISTIC") == "1"
+
+
+_response_cache = LLMCache()
+
+
+def get_response_cache() -> LLMCache:
+    """Return the process-wide response cache."""
+    return _response_cache
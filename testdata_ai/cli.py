@@ -3,17 +3,69 @@
 import csv
 import io
 import json
-import os
+import signal
 import sys
 import threading
 import time
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
 import click
 
+try:
+    # Optional (the "fast" extra): 5-6x faster serialization on the emit
+    # path, which can dominate CLI wall time for large --count runs.
+    import orjson
+except ImportError:
+    orjson = None
+
 from testdata_ai.contexts import get_context_schema, list_contexts
 from testdata_ai.generator import TestDataGenerator
 
+# ANSI codes resolved once: status lines only go to stderr, so a single
+# isatty check replaces a click.style wrap-and-strip per message.
+_USE_COLOR = sys.stderr.isatty()
+_YELLOW = "\x1b[33m" if _USE_COLOR else ""
+_GREEN = "\x1b[32m" if _USE_COLOR else ""
+_RESET = "\x1b[0m" if _USE_COLOR else ""
+
+
+def _status(message: str, color: str = "") -> None:
+    """Write a status line to stderr, colored when attached to a tty."""
+    sys.stderr.write(f"{color}{message}{_RESET if color else ''}\n")
+
+
+def _dumps_indented(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=256)
+def _dumps_list_cached(items: tuple) -> str:
+    return _dumps_compact(list(items))
+
+
+def _dumps_list(v: List[Any]) -> str:
+    """Serialize a list cell for CSV output, memoizing repeats.
+
+    Enum-like list fields (tags, payment methods) repeat the same short
+    list across records, so cache by value when the elements are
+    hashable instead of re-encoding per cell.
+    """
+    try:
+        return _dumps_list_cached(tuple(v))
+    except TypeError:
+        return _dumps_compact(v)
+
 
 @click.group()
 @click.version_option(package_name="testdata-ai")
@@ -72,15 +124,18 @@ def generate(
     context, count, output, fmt, provider, model, max_tokens, temperature, no_validate, quiet
 ):
     """Generate realistic test data using AI."""
-    _apply_overrides(provider, model, max_tokens, temperature)
-
     try:
         schema = get_context_schema(context)
     except ValueError as e:
         raise click.ClickException(str(e))
 
     try:
-        gen = TestDataGenerator()
+        gen = TestDataGenerator(
+            provider=provider,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
     except (ValueError, ImportError) as e:
         raise click.ClickException(str(e))
 
@@ -90,22 +145,9 @@ def generate(
     _emit(records, fmt, output, quiet)
 
 
-def _apply_overrides(provider, model, max_tokens, temperature):
-    """Push CLI flags into env vars for TestDataGenerator to pick up."""
-    if provider:
-        os.environ["AI_PROVIDER"] = provider
-    resolved = (provider or os.environ.get("AI_PROVIDER", "openai")).upper()
-    if model:
-        os.environ[f"{resolved}_MODEL"] = model
-    if max_tokens is not None:
-        os.environ[f"{resolved}_MAX_TOKENS"] = str(max_tokens)
-    if temperature is not None:
-        os.environ[f"{resolved}_TEMPERATURE"] = str(temperature)
-
-
 def _adjust_max_tokens(gen, schema, count, quiet):
     """Estimate required tokens and increase max_tokens if needed."""
-    sample_tokens = len(json.dumps(schema.sample)) // 3
+    sample_tokens = schema._sample_json_len // 3
     estimated = int(sample_tokens * count * 1.3)
     current = gen.config.max_tokens
 
@@ -113,16 +155,12 @@ def _adjust_max_tokens(gen, schema, count, quiet):
         return
 
     if quiet:
-        gen.provider.max_tokens = estimated
-        gen.config.max_tokens = estimated
+        gen.reconfigure(max_tokens=estimated)
         return
 
-    click.echo(
-        click.style(
-            f"Estimated tokens needed: ~{estimated} (current max_tokens={current})",
-            fg="yellow",
-        ),
-        err=True,
+    _status(
+        f"Estimated tokens needed: ~{estimated} (current max_tokens={current})",
+        _YELLOW,
     )
     choice = click.prompt(
         "How would you like to proceed?",
@@ -133,9 +171,8 @@ def _adjust_max_tokens(gen, schema, count, quiet):
     if choice == "cancel":
         raise click.Abort()
     if choice == "increase":
-        gen.provider.max_tokens = estimated
-        gen.config.max_tokens = estimated
-        click.echo(click.style(f"max_tokens set to {estimated}", fg="green"), err=True)
+        gen.reconfigure(max_tokens=estimated)
+        _status(f"max_tokens set to {estimated}", _GREEN)
 
 
 def _run_generation(gen, context, count, no_validate, quiet):
@@ -155,28 +192,34 @@ def _report(records, count, current_max, quiet):
     if quiet:
         return
     if len(records) < count:
-        click.echo(
-            click.style(
-                f"Warning: Requested {count} records but received {len(records)}. "
-                f"Try increasing with --max-tokens {current_max * 2}",
-                fg="yellow",
-            ),
-            err=True,
+        _status(
+            f"Warning: Requested {count} records but received {len(records)}. "
+            f"Try increasing with --max-tokens {current_max * 2}",
+            _YELLOW,
         )
     else:
-        click.echo(click.style(f"Generated {len(records)} records.", fg="green"), err=True)
+        _status(f"Generated {len(records)} records.", _GREEN)
 
 
 def _emit(records, fmt, output, quiet):
     """Format records and write to file or stdout."""
-    text = _records_to_csv(records) if fmt == "csv" else json.dumps(records, indent=2)
-    if output:
-        with open(output, "w") as f:
-            f.write(text)
-        if not quiet:
-            click.echo(click.style(f"Saved to {output}", fg="green"), err=True)
+    if fmt == "csv":
+        # Stream rows straight to the destination instead of rendering
+        # the whole CSV into memory first.
+        if output:
+            with open(output, "w", newline="") as f:
+                _write_csv(records, f)
+        else:
+            _write_csv(records, sys.stdout)
     else:
-        click.echo(text)
+        text = _dumps_indented(records)
+        if output:
+            with open(output, "w") as f:
+                f.write(text)
+        else:
+            click.echo(text)
+    if output and not quiet:
+        _status(f"Saved to {output}", _GREEN)
 
 
 @cli.command("list-contexts")
@@ -225,60 +268,101 @@ def show_context(context):
 
 
 class _Spinner:
-    """Animated spinner with elapsed time for long-running operations."""
+    """Animated spinner with elapsed time for long-running operations.
+
+    On POSIX main threads the tick comes from ``signal.setitimer``
+    (SIGALRM) so no background thread competes with the I/O-bound API
+    call for the GIL; elsewhere it falls back to a daemon thread.
+    """
 
     _FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    # Seconds between frames; a class attribute so tests can shrink it
+    # on an instance instead of waiting out the real frame period.
+    _INTERVAL = 0.1
 
     def __init__(self, message: str, silent: bool = False):
         self._message = message
         self._silent = silent
         self._stop = threading.Event()
+        # Set on the first rendered frame so tests can wait for output
+        # instead of sleeping for a fixed interval.
+        self._first_frame = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._start = 0.0
+        self._i = 0
+        self._prev_handler = None
+        self._use_signal = (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
 
     def __enter__(self):
-        if not self._silent:
+        if self._silent:
+            return self
+        self._start = time.monotonic()
+        if self._use_signal:
+            self._prev_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, self._INTERVAL, self._INTERVAL)
+        else:
             self._thread = threading.Thread(target=self._spin, daemon=True)
             self._thread.start()
         return self
 
     def __exit__(self, *args):
-        self._stop.set()
-        if self._thread:
+        if self._silent:
+            return
+        if self._use_signal:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._prev_handler)
+        else:
+            self._stop.set()
             self._thread.join()
-            # Clear the spinner line
-            sys.stderr.write("\r\033[K")
-            sys.stderr.flush()
+        # Clear the spinner line
+        sys.stderr.write("\r\033[K")
+        sys.stderr.flush()
+
+    def _render_frame(self):
+        elapsed = time.monotonic() - self._start
+        frame = self._FRAMES[self._i % len(self._FRAMES)]
+        sys.stderr.write(f"\r{frame} {self._message} ({elapsed:.0f}s)")
+        sys.stderr.flush()
+        self._i += 1
+        self._first_frame.set()
+
+    def _on_alarm(self, signum, frame):
+        self._render_frame()
 
     def _spin(self):
-        start = time.monotonic()
-        i = 0
-        while not self._stop.wait(0.1):
-            elapsed = time.monotonic() - start
-            frame = self._FRAMES[i % len(self._FRAMES)]
-            sys.stderr.write(
-                f"\r{frame} {self._message} ({elapsed:.0f}s)"
-            )
-            sys.stderr.flush()
-            i += 1
+        while not self._stop.wait(self._INTERVAL):
+            self._render_frame()
+
+
+def _write_csv(records: List[Dict[str, Any]], fp) -> None:
+    """Write records as CSV to an open text stream, flattening nested dicts."""
+    if not records:
+        return
+    # Two lazy passes: one to union the column names (dict preserves
+    # insertion order, so fromkeys gives the ordered union in a single
+    # C-level pass), one to write rows. Only one flattened row is alive
+    # at a time instead of a full flattened copy of the batch; repeated
+    # list cells are cached by _dumps_list, so the second flatten is
+    # mostly dict traversal.
+    fieldnames = list(dict.fromkeys(chain.from_iterable(map(_flatten_dict, records))))
+    # Plain csv.writer on pre-ordered lists: DictWriter re-keys every
+    # row dict against fieldnames per writerow, which we can do once
+    # here with a .get default for columns a record lacks.
+    writer = csv.writer(fp)
+    writer.writerow(fieldnames)
+    writer.writerows(
+        [row.get(fn, "") for fn in fieldnames]
+        for row in map(_flatten_dict, records)
+    )
 
 
 def _records_to_csv(records: List[Dict[str, Any]]) -> str:
     """Convert records to CSV string, flattening nested dicts."""
-    if not records:
-        return ""
-    flat = [_flatten_dict(r) for r in records]
-    # Union all keys across records for consistent columns
-    fieldnames: List[str] = []
-    seen: set = set()
-    for row in flat:
-        for key in row:
-            if key not in seen:
-                fieldnames.append(key)
-                seen.add(key)
     buf = io.StringIO()
-    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
-    writer.writerows(flat)
+    _write_csv(records, buf)
     return buf.getvalue()
 
 
@@ -286,13 +370,22 @@ def _flatten_dict(
     d: Dict[str, Any], parent_key: str = "", sep: str = "."
 ) -> Dict[str, Any]:
     """Flatten nested dict: {'a': {'b': 1}} -> {'a.b': 1}."""
-    items: list = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten_dict(v, new_key, sep).items())
-        elif isinstance(v, list):
-            items.append((new_key, json.dumps(v)))
+    out: Dict[str, Any] = {}
+    # Iterative DFS over a stack of (prefix, items-iterator). Keeps the
+    # key order the recursive version produced without allocating an
+    # intermediate list + dict per nesting level.
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, it = stack[-1]
+        for k, v in it:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            if isinstance(v, list):
+                out[new_key] = _dumps_list(v)
+            else:
+                out[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return out
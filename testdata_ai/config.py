@@ -4,34 +4,102 @@ Loads settings from environment variables.
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from dataclasses import dataclass, field
-from dotenv import load_dotenv
-
-load_dotenv()
 
 __all__ = ["AIProviderConfig", "get_provider_config"]
 
+# .env loading is deferred to the first get_provider_config call so that
+# importing this module (e.g. for list-contexts) stays free of file I/O.
+_dotenv_loaded = False
+
 DEFAULT_MODELS = {
     "openai": "gpt-4o-mini",
     "anthropic": "claude-haiku-4-5-20251001",
 }
 
+# Env-var prefixes normalized once at import instead of .upper() per call.
+_ENV_PREFIXES = {provider: provider.upper() for provider in DEFAULT_MODELS}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AIProviderConfig:
-    """Configuration for an AI provider."""
+    """Configuration for an AI provider.
+
+    Frozen and slotted: per-instance footprint stays small, attribute
+    access stays cheap, and a config can be shared or used as a cache
+    key without defensive copies. Adjustments (CLI overrides, the
+    max-tokens estimate) go through dataclasses.replace so
+    __post_init__ revalidates.
+    """
     provider: str
     api_key: str = field(repr=False)
     model: str
     temperature: float = 0.7
     max_tokens: int = 4096
+    max_concurrency: int = 8
+    rpm: Optional[int] = None
+    api_keys: Tuple[str, ...] = field(default=(), repr=False)
 
     def __post_init__(self) -> None:
+        if self.api_keys:
+            object.__setattr__(self, "api_keys", tuple(self.api_keys))
+            if not all(key.strip() for key in self.api_keys):
+                raise ValueError("api_keys must not contain empty keys")
+        else:
+            object.__setattr__(self, "api_keys", (self.api_key,))
         if not 0.0 <= self.temperature <= 1.0:
             raise ValueError(f"temperature must be 0.0-1.0, got {self.temperature}")
         if self.max_tokens < 1:
             raise ValueError(f"max_tokens must be >= 1, got {self.max_tokens}")
+        if self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got {self.max_concurrency}"
+            )
+        if self.rpm is not None and self.rpm < 1:
+            raise ValueError(f"rpm must be >= 1, got {self.rpm}")
+
+    @classmethod
+    def from_overrides(
+        cls,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> "AIProviderConfig":
+        """Resolve config from the environment with explicit overrides winning.
+
+        Lets callers (notably the CLI) pass flags straight into the
+        config instead of round-tripping them through os.environ.
+
+        Args:
+            provider: Provider name ('openai', 'anthropic', None=default from env)
+            model: Model name override (None keeps the env/default value)
+            max_tokens: Max-tokens override (None keeps the env/default value)
+            temperature: Temperature override (None keeps the env/default value)
+
+        Returns:
+            AIProviderConfig with overrides applied
+
+        Raises:
+            ValueError: If provider is unsupported, the API key is missing,
+                or an override value is out of range
+        """
+        base = get_provider_config(provider)
+        if model is None and max_tokens is None and temperature is None:
+            return base
+        # Rebuild rather than mutate so __post_init__ revalidates overrides.
+        return cls(
+            provider=base.provider,
+            api_key=base.api_key,
+            model=model if model is not None else base.model,
+            temperature=temperature if temperature is not None else base.temperature,
+            max_tokens=max_tokens if max_tokens is not None else base.max_tokens,
+            max_concurrency=base.max_concurrency,
+            rpm=base.rpm,
+            api_keys=base.api_keys,
+        )
 
 
 def get_provider_config(provider: Optional[str] = None) -> AIProviderConfig:
@@ -46,6 +114,13 @@ def get_provider_config(provider: Optional[str] = None) -> AIProviderConfig:
     Raises:
         ValueError: If provider not supported or API key missing
     """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
     provider = (provider or os.getenv("AI_PROVIDER", "openai")).lower()
 
     if provider not in DEFAULT_MODELS:
@@ -54,19 +129,64 @@ def get_provider_config(provider: Optional[str] = None) -> AIProviderConfig:
             f"Unsupported AI provider: '{provider}'. Supported: {supported}"
         )
 
-    prefix = provider.upper()
+    prefix = _ENV_PREFIXES[provider]
+    rpm = os.getenv(f"{prefix}_RPM")
+
+    kwargs = _parse_env(
+        provider,
+        os.getenv(f"{prefix}_API_KEYS", ""),
+        os.getenv(f"{prefix}_API_KEY", ""),
+        os.getenv(f"{prefix}_MODEL", DEFAULT_MODELS[provider]),
+        os.getenv(f"{prefix}_TEMPERATURE", "0.7"),
+        os.getenv(f"{prefix}_MAX_TOKENS", "4096"),
+        os.getenv(f"{prefix}_MAX_CONCURRENCY", "8"),
+        rpm,
+    )
+    return AIProviderConfig(**kwargs)
+
+
+@lru_cache(maxsize=8)
+def _parse_env(
+    provider: str,
+    raw_api_keys: str,
+    raw_api_key: str,
+    model: str,
+    raw_temperature: str,
+    raw_max_tokens: str,
+    raw_max_concurrency: str,
+    raw_rpm: Optional[str],
+):
+    """Parse raw environment values into AIProviderConfig kwargs.
+
+    Keyed on the raw strings, so a changed environment re-parses while
+    repeated construction against an unchanged one is a cache lookup.
+    Only the kwargs dict is cached; AIProviderConfig itself is frozen,
+    so building a fresh instance per call is belt-and-braces cheap.
 
-    api_key = os.getenv(f"{prefix}_API_KEY", "").strip()
+    Raises:
+        ValueError: If no API key is configured
+    """
+    prefix = _ENV_PREFIXES[provider]
+
+    api_keys = tuple(
+        key.strip() for key in raw_api_keys.split(",") if key.strip()
+    )
+    api_key = raw_api_key.strip()
+    if not api_key and api_keys:
+        api_key = api_keys[0]
     if not api_key:
         raise ValueError(
             f"{prefix} API key not found! "
             f"Set {prefix}_API_KEY in .env file or environment."
         )
 
-    return AIProviderConfig(
-        provider=provider,
-        api_key=api_key,
-        model=os.getenv(f"{prefix}_MODEL", DEFAULT_MODELS[provider]),
-        temperature=float(os.getenv(f"{prefix}_TEMPERATURE", "0.7")),
-        max_tokens=int(os.getenv(f"{prefix}_MAX_TOKENS", "4096")),
-    )
+    return {
+        "provider": provider,
+        "api_key": api_key,
+        "model": model,
+        "temperature": float(raw_temperature),
+        "max_tokens": int(raw_max_tokens),
+        "max_concurrency": int(raw_max_concurrency),
+        "rpm": int(raw_rpm) if raw_rpm else None,
+        "api_keys": api_keys,
+    }
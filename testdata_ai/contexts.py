@@ -16,8 +16,12 @@ __all__ = [
     "validate_generated_data",
 ]
 
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+import json
+import sys
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 
 class ValidationError(ValueError):
@@ -35,38 +39,59 @@ class ValidationError(ValueError):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextSchema:
     """Schema definition for a test data context.
 
     The required fields are derived from the top-level keys of ``sample``,
     so there is a single source of truth for the record structure.
+    Frozen and slotted: schemas are immutable module-level constants,
+    so attribute access skips __dict__ and instances stay small.
     """
 
     description: str
     sample: Dict[str, Any]
     prompt_hints: List[str]
     category: str = "general"
+    _fields: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _fields_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _sample_json_len: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Precompute once: validation touches these per record, and
+        # rebuilding list(sample.keys()) in that loop is pure overhead.
+        # object.__setattr__ because the dataclass is frozen.
+        # Interned field names keep their cached hashes, so membership
+        # tests against parsed-JSON record dicts skip re-hashing.
+        object.__setattr__(
+            self, "_fields", tuple(sys.intern(k) for k in self.sample)
+        )
+        object.__setattr__(self, "_fields_set", frozenset(self._fields))
+        object.__setattr__(
+            self,
+            "_sample_json_len",
+            len(json.dumps(self.sample, separators=(",", ":"))),
+        )
 
     @property
     def fields(self) -> List[str]:
         """Required field names, derived from sample keys."""
-        return list(self.sample.keys())
+        return list(self._fields)
 
     def validate_record(self, record: Dict[str, Any]) -> bool:
         """Check if a record has all required fields."""
         if not isinstance(record, dict):
             return False
-        return all(f in record for f in self.fields)
+        return self._fields_set.issubset(record)
 
     def missing_fields(self, record: Dict[str, Any]) -> List[str]:
         """Return list of required fields missing from a record."""
         if not isinstance(record, dict):
-            return list(self.fields)
-        return [f for f in self.fields if f not in record]
+            return list(self._fields)
+        return [f for f in self._fields if f not in record]
 
 
-CONTEXTS: Dict[str, ContextSchema] = {
+_CONTEXTS: Dict[str, ContextSchema] = {
     "ecommerce_customer": ContextSchema(
         description="e-commerce customer profiles",
         category="ecommerce",
@@ -458,14 +483,29 @@ def get_context_schema(context: str) -> ContextSchema:
     return CONTEXTS[context]
 
 
+# Read-only view: schemas are module constants, and downstream caches
+# (prompt fragments, category index) rely on them never changing.
+CONTEXTS: Mapping[str, ContextSchema] = MappingProxyType(_CONTEXTS)
+
+# Category filter index, built once after CONTEXTS: category -> names.
+# Tuples, so list_contexts copies via a C-level memcpy and the cached
+# values can never be mutated through a leaked reference.
+_index: Dict[str, List[str]] = {}
+for _name, _schema in CONTEXTS.items():
+    _index.setdefault(_schema.category, []).append(_name)
+_CATEGORY_INDEX: Dict[str, Tuple[str, ...]] = {
+    category: tuple(names) for category, names in _index.items()
+}
+del _name, _schema, _index
+
+_ALL_CONTEXTS: Tuple[str, ...] = tuple(CONTEXTS)
+
+
 def list_contexts(category: Optional[str] = None) -> List[str]:
     """List available context names, optionally filtered by category."""
     if category is None:
-        return list(CONTEXTS.keys())
-    return [
-        name for name, schema in CONTEXTS.items()
-        if schema.category == category
-    ]
+        return list(_ALL_CONTEXTS)
+    return list(_CATEGORY_INDEX.get(category, ()))
 
 
 def validate_generated_data(
@@ -482,8 +522,30 @@ def validate_generated_data(
         'missing_fields'. Empty list means all records are valid.
     """
     schema = get_context_schema(context)
-    return [
-        {"record_index": i, "missing_fields": schema.missing_fields(record)}
-        for i, record in enumerate(records)
-        if not schema.validate_record(record)
-    ]
+    # Hot path for large batches: bind the precomputed field tuple/set to
+    # locals and do one containment check per record, only walking the
+    # field list again for records that actually fail.
+    fields = schema._fields
+    fset = schema._fields_set
+    if not fset:
+        # Nothing to require, so every record is trivially valid.
+        return []
+    issubset = fset.issubset
+    # Happy path: one containment check per record with no index
+    # bookkeeping or per-record allocations. Only on failure does the
+    # detailed pass below run to collect indices and missing fields.
+    if all(isinstance(r, dict) and issubset(r) for r in records):
+        return []
+    invalid: List[Dict[str, Any]] = []
+    append = invalid.append
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            append({"record_index": i, "missing_fields": list(fields)})
+        elif not fset.issubset(record):
+            append(
+                {
+                    "record_index": i,
+                    "missing_fields": [f for f in fields if f not in record],
+                }
+            )
+    return invalid
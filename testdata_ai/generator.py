@@ -5,12 +5,17 @@ Supports OpenAI, Anthropic, and other AI providers.
 
 __all__ = ["TestDataGenerator", "generate"]
 
+import asyncio
 import json
-import re
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 import logging
 
-from testdata_ai.prompts import get_prompt
+from testdata_ai.prompts import get_prompt, get_system_prompt, get_multi_prompt
 from testdata_ai.contexts import (
     get_context_schema,
     validate_generated_data,
@@ -19,7 +24,25 @@ from testdata_ai.contexts import (
     ValidationError,
 )
 from testdata_ai.config import get_provider_config, AIProviderConfig, DEFAULT_MODELS
-from testdata_ai.ai_providers import get_provider, AIProvider
+from testdata_ai.ai_providers import (
+    get_provider,
+    get_async_provider,
+    AIProvider,
+    AsyncAIProvider,
+    DEFAULT_SYSTEM_PROMPT,
+)
+from testdata_ai.cache import LLMCache, get_response_cache, cache_enabled
+
+try:
+    # orjson (the "fast" extra) parses large responses 3-10x faster than
+    # stdlib json; its JSONDecodeError subclasses json.JSONDecodeError,
+    # so the error handling below works for both.
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +67,8 @@ class TestDataGenerator:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        config: Optional[AIProviderConfig] = None,
     ):
         """Initialize the generator.
 
@@ -52,13 +77,18 @@ class TestDataGenerator:
             api_key: API key (if None, reads from .env based on provider)
             model: Model name (if None, uses default for provider)
             temperature: Sampling temperature 0.0-1.0 (if None, uses default)
+            max_tokens: Max tokens for AI responses (if None, uses default)
+            config: Pre-built AIProviderConfig; takes precedence over the
+                other arguments when given
 
         Note:
             If arguments are None, values are read from the .env file.
             When passing api_key, provider is required; model and temperature
             will use provider defaults if not specified.
         """
-        if api_key is not None:
+        if config is not None:
+            self.config = config
+        elif api_key is not None:
             if not api_key.strip():
                 raise ValueError("api_key must not be empty")
             if provider is None:
@@ -75,22 +105,67 @@ class TestDataGenerator:
                 api_key=api_key,
                 model=model or DEFAULT_MODELS[provider],
                 temperature=temperature if temperature is not None else 0.7,
+                max_tokens=max_tokens if max_tokens is not None else 4096,
             )
-        else:
+        elif model is None and max_tokens is None and temperature is None:
             self.config = get_provider_config(provider)
+        else:
+            self.config = AIProviderConfig.from_overrides(
+                provider, model=model, max_tokens=max_tokens, temperature=temperature
+            )
 
-        self.provider: AIProvider = get_provider(
-            provider_name=self.config.provider,
-            api_key=self.config.api_key,
-            model=self.config.model,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
-        )
+        self._aprovider: Optional[AsyncAIProvider] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._provider: Optional[AIProvider] = None
+        self._generate = None  # bound together with the provider
 
-        logger.info(
-            f"Initialized generator with {self.config.provider} provider "
-            f"(model: {self.config.model})"
-        )
+    @property
+    def provider(self) -> AIProvider:
+        """Sync provider instance, constructed lazily on first use.
+
+        Construction imports the provider SDK and builds an HTTP client,
+        so context-browsing calls never pay for it. Providers with
+        identical settings are shared process-wide via _cached_provider.
+        """
+        if self._provider is None:
+            self.provider = _cached_provider(
+                self.config.provider,
+                self.config.api_key,
+                self.config.model,
+                self.config.temperature,
+                self.config.max_tokens,
+                self.config.api_keys,
+            )
+            logger.info(
+                f"Initialized generator with {self.config.provider} provider "
+                f"(model: {self.config.model})"
+            )
+        return self._provider
+
+    @provider.setter
+    def provider(self, value: AIProvider) -> None:
+        self._provider = value
+        # Pre-bound method saves an attribute lookup on the hot path.
+        self._generate = value.generate
+
+    def reconfigure(self, **overrides) -> None:
+        """Apply config overrides and drop any providers built from the old config.
+
+        _cached_provider shares one instance per settings tuple process-wide,
+        so callers must never mutate a provider in place (e.g. its
+        max_tokens) — that would leak the change into every generator with
+        the same settings. Instead, replace the config and null the lazy
+        slots; the next access builds (or cache-hits) a provider keyed on
+        the new values.
+
+        Args:
+            **overrides: AIProviderConfig field replacements
+                (e.g. ``max_tokens=8192``)
+        """
+        self.config = replace(self.config, **overrides)
+        self._provider = None
+        self._generate = None
+        self._aprovider = None
 
     def generate(
         self,
@@ -123,30 +198,403 @@ class TestDataGenerator:
         logger.info(f"Generating {count} records for context: {context}")
 
         prompt = get_prompt(context, count)  # raises ValueError if context unknown
-        logger.debug(f"Sending prompt to {self.provider.__class__.__name__}")
+        system_prompt = get_system_prompt(context)
+        # %-style so formatting is deferred unless DEBUG is emitted.
+        logger.debug("Sending prompt to %s provider", self.config.provider)
+
+        cache_key = None
+        if cache_enabled(self.config.temperature):
+            cache_key = LLMCache.make_key(
+                self.config.provider,
+                self.config.model,
+                self.config.temperature,
+                system_prompt,
+                prompt,
+            )
+
+        response = None
+        if cache_key is not None:
+            response = get_response_cache().get(cache_key)
+            if response is not None:
+                logger.debug("Response cache hit; skipping API call")
 
-        response = _strip_markdown_fences(self.provider.generate(prompt))
+        if response is None:
+            # self._generate is bound when the lazy provider is built;
+            # touching self.provider triggers that on the first call.
+            call = self._generate or self.provider.generate
+            response = call(prompt, system_prompt)
+            if cache_key is not None:
+                get_response_cache().set(cache_key, response)
 
+        records = self._parse_records(response)
+
+        logger.info(f"Successfully generated {len(records)} records")
+
+        if len(records) != count:
+            logger.warning(
+                f"Requested {count} records but received {len(records)}"
+            )
+
+        if validate:
+            invalid = validate_generated_data(context, records)
+            if invalid:
+                raise ValidationError(invalid)
+
+        return records
+
+    @property
+    def aprovider(self) -> AsyncAIProvider:
+        """Async provider instance, constructed lazily on first use."""
+        if self._aprovider is None:
+            self._aprovider = get_async_provider(
+                provider_name=self.config.provider,
+                api_key=self.config.api_key,
+                model=self.config.model,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                max_concurrency=self.config.max_concurrency,
+                rpm=self.config.rpm,
+            )
+        return self._aprovider
+
+    async def agenerate(
+        self,
+        context: str,
+        count: int = 10,
+        sub_batch: int = 5,
+        validate: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Generate test data by fanning out concurrent sub-requests.
+
+        Splits ``count`` into sub-batches of at most ``sub_batch`` records
+        and dispatches them concurrently via ``asyncio.gather``, so wall
+        time is bounded by the slowest sub-batch rather than growing
+        linearly with ``count``.
+
+        Args:
+            context: Type of data to generate (e.g., "ecommerce_customer")
+            count: Total number of records to generate
+            sub_batch: Maximum records requested per concurrent sub-request
+            validate: Whether to validate against schema (default: True)
+
+        Returns:
+            List of generated data records as dictionaries
+
+        Raises:
+            ValueError: If context is unknown or an AI response is not valid JSON
+            ValidationError: If generated records are missing required fields
+        """
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+        if sub_batch < 1:
+            raise ValueError(f"sub_batch must be >= 1, got {sub_batch}")
+
+        chunks = [
+            min(sub_batch, count - start)
+            for start in range(0, count, sub_batch)
+        ]
+        logger.info(
+            f"Generating {count} records for context: {context} "
+            f"({len(chunks)} concurrent sub-batches)"
+        )
+
+        system_prompt = get_system_prompt(context)
+        prompts = [get_prompt(context, n) for n in chunks]
+        responses = await asyncio.gather(
+            *(self.aprovider.generate(p, system_prompt) for p in prompts)
+        )
+
+        records: List[Dict[str, Any]] = []
+        for response in responses:
+            records.extend(self._parse_records(response))
+
+        logger.info(f"Successfully generated {len(records)} records")
+
+        if len(records) != count:
+            logger.warning(
+                f"Requested {count} records but received {len(records)}"
+            )
+
+        if validate:
+            invalid = validate_generated_data(context, records)
+            if invalid:
+                raise ValidationError(invalid)
+
+        return records
+
+    def prefetch(self, context: str, count: int = 10, **kwargs) -> Future:
+        """Schedule generate() on a background thread, returning a Future.
+
+        Lets callers overlap API latency with their own processing:
+        kick off the next batch, work on the current one, then call
+        ``.result()`` when the records are needed.
+
+        Args:
+            context: Type of data to generate (e.g., "ecommerce_customer")
+            count: Number of records to generate
+            **kwargs: Forwarded to generate() (e.g., validate=False)
+
+        Returns:
+            Future resolving to the list of generated records
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="testdata-ai"
+            )
+        return self._pool.submit(self.generate, context, count, **kwargs)
+
+    def generate_iter(
+        self,
+        requests: Iterable[Tuple[str, int]],
+        window: int = 2,
+        **kwargs,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield record batches for (context, count) pairs, prefetching ahead.
+
+        Keeps up to ``window`` requests in flight while the caller
+        processes each yielded batch, hiding one API round trip per
+        iteration (double-buffering when window=2).
+
+        Args:
+            requests: (context, count) pairs to generate, in order
+            window: Maximum requests in flight at once
+            **kwargs: Forwarded to generate() (e.g., validate=False)
+
+        Yields:
+            Lists of generated records, in request order
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+
+        pending: deque = deque()
+        it = iter(requests)
         try:
-            data = json.loads(response)
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.error(f"Failed to parse AI response as JSON: {e}")
-            logger.debug(f"Response preview: {response[:200]!r}")
-            raise ValueError(f"AI response is not valid JSON: {e}") from e
+            for _ in range(window):
+                context, count = next(it)
+                pending.append(self.prefetch(context, count, **kwargs))
+        except StopIteration:
+            pass
+
+        while pending:
+            done = pending.popleft()
+            try:
+                context, count = next(it)
+                pending.append(self.prefetch(context, count, **kwargs))
+            except StopIteration:
+                pass
+            yield done.result()
+
+    def generate_to_file(
+        self,
+        path,
+        context: str,
+        count: int = 10,
+        validate: bool = True,
+    ) -> int:
+        """Stream generated records straight to an NDJSON file.
 
-        # Normalize to a list of records (JSON object mode wraps arrays
-        # under an arbitrary key like "data", "customers", "records", etc.)
-        if isinstance(data, dict):
-            for value in data.values():
-                if isinstance(value, list):
-                    records = value
-                    break
-            else:
-                records = [data]
-        elif isinstance(data, list):
-            records = data
-        else:
-            records = [data]
+        Consumes the streaming parser and writes one JSON object per
+        line as each record arrives, so memory stays constant no matter
+        how large ``count`` is. NDJSON is also what downstream tooling
+        (jq, pandas ``read_json(lines=True)``) handles best.
+
+        Args:
+            path: Destination file path
+            context: Type of data to generate (e.g., "ecommerce_customer")
+            count: Number of records to generate
+            validate: Whether to validate each record against the schema
+
+        Returns:
+            Number of records written
+
+        Raises:
+            ValueError: If context is unknown or a record is not valid JSON
+            ValidationError: If a generated record is missing required fields
+        """
+        written = 0
+        with open(path, "wb") as f:
+            for record in self.stream(context, count, validate=validate):
+                f.write(_json_dumps(record))
+                f.write(b"\n")
+                written += 1
+
+        logger.info(f"Wrote {written} records to {path}")
+        return written
+
+    def generate_contexts(
+        self,
+        requests: List[tuple],
+        validate: bool = True,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate data for several contexts in one API round trip.
+
+        Merges all contexts into a single prompt asking for a JSON object
+        keyed by context name, so network latency, input-token overhead,
+        and rate-limit budget are paid once instead of per context. The
+        trade-off is a larger single response: keep the combined record
+        count modest or the model may truncate.
+
+        Args:
+            requests: (context, count) pairs; each context may appear once
+            validate: Whether to validate against schemas (default: True)
+
+        Returns:
+            Mapping of context name to its generated records
+
+        Raises:
+            ValueError: If requests is empty, a context is unknown or
+                duplicated, a count is < 1, or the response is malformed
+            ValidationError: If generated records are missing required fields
+        """
+        if not requests:
+            raise ValueError("requests must not be empty")
+        contexts = [context for context, _ in requests]
+        if len(set(contexts)) != len(contexts):
+            raise ValueError("each context may appear only once per call")
+        for context, count in requests:
+            if count < 1:
+                raise ValueError(f"count must be >= 1, got {count}")
+
+        logger.info(
+            f"Generating {len(requests)} datasets in one request: "
+            f"{', '.join(contexts)}"
+        )
+
+        prompt = get_multi_prompt(requests)  # raises ValueError if unknown
+        # The response is keyed by context name, not the {"data": [...]}
+        # envelope, so use the un-forced variant (on Anthropic the forced
+        # tool schema cannot express this shape).
+        response = self.provider.generate_freeform(prompt)
+        data = self._parse_json(response)
+
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"AI response is not a JSON object keyed by context "
+                f"(got {type(data).__name__})"
+            )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for context, count in requests:
+            records = data.get(context)
+            if not isinstance(records, list):
+                raise ValueError(f"AI response is missing the '{context}' array")
+            if len(records) != count:
+                logger.warning(
+                    f"Requested {count} '{context}' records "
+                    f"but received {len(records)}"
+                )
+            if validate:
+                invalid = validate_generated_data(context, records)
+                if invalid:
+                    raise ValidationError(invalid)
+            results[context] = records
+
+        return results
+
+    def generate_many(
+        self,
+        context: str,
+        total: int,
+        batch: int = 25,
+        max_concurrency: int = 4,
+        validate: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Generate a large dataset by fanning out concurrent batches.
+
+        Splits ``total`` into batch-sized requests run on a thread pool
+        against the shared provider client (both SDK clients are
+        thread-safe over httpx connection pooling), overlapping the
+        network round trips that dominate wall time for large counts.
+
+        Args:
+            context: Type of data to generate
+            total: Total number of records wanted
+            batch: Records requested per API call
+            max_concurrency: Maximum in-flight API calls
+            validate: Whether to validate each batch against the schema
+
+        Returns:
+            Up to ``total`` generated records, in batch submission order
+
+        Raises:
+            ValueError: If total, batch, or max_concurrency is < 1, or
+                a response is not valid JSON
+            ValidationError: If any batch fails validation
+        """
+        if total < 1:
+            raise ValueError(f"total must be >= 1, got {total}")
+        if batch < 1:
+            raise ValueError(f"batch must be >= 1, got {batch}")
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got {max_concurrency}"
+            )
+
+        sizes = [batch] * (total // batch)
+        if total % batch:
+            sizes.append(total % batch)
+
+        results: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            futures = [
+                pool.submit(self.generate, context, size, validate)
+                for size in sizes
+            ]
+            # Collect in submission order so output is deterministic.
+            for future in futures:
+                results.extend(future.result())
+        return results[:total]
+
+    def generate_bulk(
+        self,
+        context: str,
+        count: int,
+        chunk: int = 20,
+        validate: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Generate a large dataset via the provider's batch API.
+
+        Splits ``count`` into sub-requests of at most ``chunk`` records,
+        submits them as one server-side batch job, and blocks until the
+        job completes. Batch endpoints cost roughly half the synchronous
+        price and bypass per-request rate limits, but can take minutes to
+        hours — use generate()/agenerate() when latency matters.
+
+        Args:
+            context: Type of data to generate (e.g., "ecommerce_customer")
+            count: Total number of records to generate
+            chunk: Maximum records requested per batched sub-request
+            validate: Whether to validate against schema (default: True)
+
+        Returns:
+            List of generated data records as dictionaries
+
+        Raises:
+            ValueError: If context is unknown or a response is not valid JSON
+            RuntimeError: If the batch job fails or times out
+            ValidationError: If generated records are missing required fields
+        """
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+        if chunk < 1:
+            raise ValueError(f"chunk must be >= 1, got {chunk}")
+
+        chunks = [
+            min(chunk, count - start)
+            for start in range(0, count, chunk)
+        ]
+        logger.info(
+            f"Generating {count} records for context: {context} "
+            f"({len(chunks)} batched sub-requests)"
+        )
+
+        prompts = [get_prompt(context, n) for n in chunks]
+        batch_id = self.provider.submit_batch(prompts, get_system_prompt(context))
+        responses = self.provider.await_batch(batch_id)
+
+        records: List[Dict[str, Any]] = []
+        for response in responses:
+            records.extend(self._parse_records(response))
 
         logger.info(f"Successfully generated {len(records)} records")
 
@@ -162,6 +610,96 @@ class TestDataGenerator:
 
         return records
 
+    def stream(
+        self,
+        context: str,
+        count: int = 10,
+        validate: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate test data, yielding records as they arrive.
+
+        Streams the provider response and parses records incrementally,
+        so the first record is available after the model has produced it
+        rather than after the full response completes. Useful for large
+        batches and for piping records onward as they are generated.
+
+        Args:
+            context: Type of data to generate (e.g., "ecommerce_customer")
+            count: Number of records to generate
+            validate: Whether to validate each record against the schema
+                as it is yielded (default: True)
+
+        Yields:
+            Generated data records as dictionaries
+
+        Raises:
+            ValueError: If context is unknown or a record is not valid JSON
+            ValidationError: If a generated record is missing required fields
+        """
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+
+        logger.info(f"Streaming {count} records for context: {context}")
+
+        prompt = get_prompt(context, count)  # raises ValueError if context unknown
+        schema = get_context_schema(context) if validate else None
+
+        for index, record in enumerate(
+            _iter_json_records(
+                self.provider.stream(prompt, get_system_prompt(context))
+            )
+        ):
+            if schema is not None:
+                missing = schema.missing_fields(record)
+                if missing:
+                    raise ValidationError(
+                        [{"record_index": index, "missing_fields": missing}]
+                    )
+            yield record
+
+    def _parse_records(self, response: str) -> List[Dict[str, Any]]:
+        """Parse a raw AI response into a list of records.
+
+        Strips markdown fences, parses JSON, and normalizes to a list of
+        records (JSON object mode wraps arrays under an arbitrary key like
+        "data", "customers", "records", etc.)
+
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        data = self._parse_json(response)
+
+        if isinstance(data, dict):
+            # The prompt asks for a "data" key, so probe it directly and
+            # only fall back to scanning all values when the model used a
+            # different wrapper key.
+            records = data.get("data")
+            if not isinstance(records, list):
+                records = next(
+                    (v for v in data.values() if isinstance(v, list)), [data]
+                )
+        elif isinstance(data, list):
+            records = data
+        else:
+            records = [data]
+
+        return records
+
+    def _parse_json(self, response: str) -> Any:
+        """Strip markdown fences and parse a raw AI response as JSON.
+
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        response = _strip_markdown_fences(response)
+
+        try:
+            return _json_loads(response)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            logger.debug("Response preview: %r", response[:200])
+            raise ValueError(f"AI response is not valid JSON: {e}") from e
+
     def list_available_contexts(self) -> List[str]:
         """List all available context identifiers."""
         return list_contexts()
@@ -171,29 +709,126 @@ class TestDataGenerator:
         return get_context_schema(context)
 
 
-_MARKDOWN_FENCE_RE = re.compile(r"^(?:```[^\n]*\n)?(.*?)(?:```\s*)?$", re.DOTALL)
+def _iter_json_records(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse JSON objects out of a streamed response.
+
+    Scans text chunks for the first top-level JSON array (the "data" array
+    providers are prompted to emit) and yields each complete object inside
+    it as soon as its closing brace arrives, without buffering the full
+    response. Text outside the array (object keys, markdown fences) is
+    skipped; string contents and nested structures are tracked so braces
+    inside values don't confuse the scan.
+    """
+    in_string = False
+    escape = False
+    in_array = False
+    obj_chars: List[str] = []
+    obj_depth = 0
+
+    for chunk in chunks:
+        for ch in chunk:
+            if obj_chars:
+                obj_chars.append(ch)
+                if in_string:
+                    if escape:
+                        escape = False
+                    elif ch == "\\":
+                        escape = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch in "{[":
+                    obj_depth += 1
+                elif ch in "}]":
+                    obj_depth -= 1
+                    if obj_depth == 0:
+                        yield _json_loads("".join(obj_chars))
+                        obj_chars = []
+                continue
+
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif not in_array:
+                if ch == "[":
+                    in_array = True
+            elif ch == "{":
+                obj_chars = [ch]
+                obj_depth = 1
+            elif ch == "]":
+                return
 
 
 def _strip_markdown_fences(text: str) -> str:
     """Remove markdown code fences that some AI providers wrap JSON in.
 
     Handles all common fence variants (```json, ```JSON, ``` json, etc.),
-    including missing closing fences.
+    including missing opening or closing fences. A branchy string scan
+    rather than a regex: the common clean-JSON case costs one startswith
+    and one endswith, with no match-object allocation for fenced input.
     """
     text = text.strip()
-    # Regex always matches (all groups are optional), so .group(1) is safe.
-    return _MARKDOWN_FENCE_RE.match(text).group(1).strip()
+    if not text.startswith("```"):
+        # No opening fence; a stray trailing fence can still appear.
+        return text.removesuffix("```").rstrip()
+    nl = text.find("\n")
+    if nl == -1:
+        return text
+    end = text.rfind("```")
+    body = text[nl + 1:end] if end > nl else text[nl + 1:]
+    return body.strip()
+
+
+@lru_cache(maxsize=8)
+def _cached_provider(
+    provider_name: str,
+    api_key: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    api_keys: Tuple[str, ...],
+) -> AIProvider:
+    """Process-wide provider cache keyed on the full provider settings.
+
+    Repeated generator construction with identical settings (the CLI,
+    the module-level generate() helper, notebooks) reuses one SDK client
+    and its connection pool instead of rebuilding TLS state per call.
+    """
+    return get_provider(
+        provider_name=provider_name,
+        api_key=api_key,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_keys=api_keys,
+    )
+
+
+_default_generator: Optional[TestDataGenerator] = None
+_default_generator_lock = threading.Lock()
 
 
 def generate(context: str, count: int = 10) -> List[Dict[str, Any]]:
     """Convenience function for one-off generation.
 
-    Creates a new TestDataGenerator each call. For repeated use,
-    instantiate TestDataGenerator directly.
+    Reuses a module-level TestDataGenerator built from the environment
+    on first call. For custom settings, instantiate TestDataGenerator
+    directly.
 
     Example:
         >>> from testdata_ai import generate
         >>> customers = generate('ecommerce_customer', 20)
     """
-    gen = TestDataGenerator()
-    return gen.generate(context, count)
+    global _default_generator
+    if _default_generator is None:
+        with _default_generator_lock:
+            if _default_generator is None:
+                _default_generator = TestDataGenerator()
+    return _default_generator.generate(context, count)
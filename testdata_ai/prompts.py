@@ -2,19 +2,56 @@
 Prompt builder for AI test data generation.
 
 Builds prompts dynamically from context schemas (fields, sample, hints)
-so there is a single source of truth in contexts.py.
+so there is a single source of truth in contexts.py. Context dispatch is
+an O(1) lookup in the CONTEXTS mapping — adding a context never adds a
+branch here — and the rendered per-context fragments are lru_cache'd.
 """
 
-__all__ = ["get_prompt"]
+__all__ = ["get_prompt", "get_system_prompt", "get_multi_prompt"]
 
 import json
+from functools import lru_cache
 
+from testdata_ai.ai_providers import DEFAULT_SYSTEM_PROMPT
 from testdata_ai.contexts import get_context_schema
 
 
+@lru_cache(maxsize=256)
+def _prompt_parts(context: str):
+    """Return the constant prompt fragments for a context.
+
+    The hints block and the indented sample JSON only depend on the context
+    schema, so they are rendered once and cached rather than rebuilt on
+    every generate() call.
+
+    Raises:
+        ValueError: If context is unknown
+    """
+    schema = get_context_schema(context)
+    hints = "\n".join(f"- {hint}" for hint in schema.prompt_hints)
+    sample_json = json.dumps(schema.sample, indent=2)
+    return schema.description, hints, sample_json
+
+
+@lru_cache(maxsize=256)
+def _prompt_template(context: str) -> str:
+    """Return the per-context prompt template with a {count} placeholder."""
+    description, _, _ = _prompt_parts(context)
+    return (
+        f"Generate exactly {{count}} realistic {description}. "
+        f"Return a JSON object with a \"data\" key containing an array "
+        f"of exactly {{count}} objects. Example: {{{{\"data\": [...]}}}}"
+    )
+
+
+@lru_cache(maxsize=256)
 def get_prompt(context: str, count: int) -> str:
     """Build a prompt for the given context and record count.
 
+    Identical (context, count) pairs recur across batches, so the fully
+    rendered prompt is memoized on top of the cached per-context
+    template.
+
     Args:
         context: Context identifier (e.g., 'ecommerce_customer')
         count: Number of records to generate (must be >= 1)
@@ -25,20 +62,78 @@ def get_prompt(context: str, count: int) -> str:
     Raises:
         ValueError: If context is unknown
     """
-    schema = get_context_schema(context)
+    return _prompt_template(context).format(count=count)
 
-    hints = "\n".join(f"- {hint}" for hint in schema.prompt_hints)
-    sample_json = json.dumps(schema.sample, indent=2)
+
+@lru_cache(maxsize=256)
+def get_system_prompt(context: str) -> str:
+    """Build the static system prompt for a context.
+
+    Everything that doesn't vary between calls — the hints and the
+    sample record structure — lives here rather than in the user
+    prompt: both providers cache system prompts server-side, so the
+    bulk of the input tokens is only paid for once, and the per-call
+    user prompt shrinks to a single line.
+
+    Args:
+        context: Context identifier (e.g., 'ecommerce_customer')
+
+    Returns:
+        System prompt string for the given context
+
+    Raises:
+        ValueError: If context is unknown
+    """
+    description, hints, sample_json = _prompt_parts(context)
 
     return (
-        f"Generate exactly {count} realistic {schema.description}.\n"
+        f"{DEFAULT_SYSTEM_PROMPT}\n"
         f"\n"
-        f"Return a JSON object with a \"data\" key containing an array "
-        f"of exactly {count} objects. Example: {{\"data\": [...]}}\n"
+        f"You generate {description}.\n"
         f"\n"
         f"Requirements for realistic data:\n"
         f"{hints}\n"
         f"\n"
-        f"Each object in the array must follow this structure:\n"
+        f"Each object in the \"data\" array must follow this structure:\n"
         f"{sample_json}\n"
     )
+
+
+def get_multi_prompt(requests) -> str:
+    """Build one prompt covering several contexts at once.
+
+    Asks for a single JSON object keyed by context name, so multiple
+    datasets share one API round trip instead of paying per-context
+    network and rate-limit overhead.
+
+    Args:
+        requests: Sequence of (context, count) pairs
+
+    Returns:
+        Formatted prompt string ready to send to AI
+
+    Raises:
+        ValueError: If any context is unknown
+    """
+    keys = ", ".join(f'"{context}"' for context, _ in requests)
+
+    sections = []
+    for context, count in requests:
+        description, hints, sample_json = _prompt_parts(context)
+        sections.append(
+            f"Dataset \"{context}\": exactly {count} realistic {description}.\n"
+            f"Requirements for realistic data:\n"
+            f"{hints}\n"
+            f"Each object in \"{context}\" must follow this structure:\n"
+            f"{sample_json}\n"
+        )
+
+    return (
+        f"Generate multiple test datasets in a single response.\n"
+        f"\n"
+        f"Return a JSON object with exactly these keys: {keys}. "
+        f"Each key must contain an array with exactly the requested "
+        f"number of objects for that dataset.\n"
+        f"\n"
+        + "\n".join(sections)
+    )
@@ -1,28 +1,44 @@
 """Shared fixtures for testdata-ai tests."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 from click.testing import CliRunner
 
-from testdata_ai.ai_providers import OpenAIProvider, AnthropicProvider
+from testdata_ai.ai_providers import (
+    OpenAIProvider,
+    AnthropicProvider,
+    AsyncOpenAIProvider,
+    AsyncAnthropicProvider,
+)
+from testdata_ai import config as config_module
 from testdata_ai.contexts import ContextSchema
 
 
-@pytest.fixture
+# CliRunner keeps no state between .invoke() calls, so one instance
+# serves the whole session.
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
+_AI_ENV_VARS = (
+    "AI_PROVIDER",
+    "OPENAI_API_KEY", "OPENAI_API_KEYS", "OPENAI_MODEL", "OPENAI_TEMPERATURE", "OPENAI_MAX_TOKENS",
+    "OPENAI_RPM", "OPENAI_MAX_CONCURRENCY",
+    "ANTHROPIC_API_KEY", "ANTHROPIC_API_KEYS", "ANTHROPIC_MODEL", "ANTHROPIC_TEMPERATURE", "ANTHROPIC_MAX_TOKENS",
+    "ANTHROPIC_RPM", "ANTHROPIC_MAX_CONCURRENCY",
+)
+
+
 @pytest.fixture
 def clean_ai_env_fixture(monkeypatch):
     """Internal fixture that cleans AI-related environment variables for isolation."""
-    for var in [
-        "AI_PROVIDER",
-        "OPENAI_API_KEY", "OPENAI_MODEL", "OPENAI_TEMPERATURE", "OPENAI_MAX_TOKENS",
-        "ANTHROPIC_API_KEY", "ANTHROPIC_MODEL", "ANTHROPIC_TEMPERATURE", "ANTHROPIC_MAX_TOKENS",
-    ]:
+    for var in _AI_ENV_VARS:
         monkeypatch.delenv(var, raising=False)
+    # _parse_env is keyed on the raw env values, so stale hits can't
+    # happen; clearing just keeps cached-config state out of other tests.
+    config_module._parse_env.cache_clear()
     return monkeypatch
 
 
@@ -46,16 +62,55 @@ def anthropic_provider_mock():
     return provider, mock_client
 
 
+@pytest.fixture
+def async_openai_provider_mock():
+    """Create an AsyncOpenAIProvider with a mocked async client."""
+    with patch.object(AsyncOpenAIProvider, "_init_client"):
+        provider = AsyncOpenAIProvider("sk-fake", "gpt-4o-mini", 0.7, 4096)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
+    provider.client = mock_client
+    return provider, mock_client
+
+
+@pytest.fixture
+def async_anthropic_provider_mock():
+    """Create an AsyncAnthropicProvider with a mocked async client."""
+    with patch.object(AsyncAnthropicProvider, "_init_client"):
+        provider = AsyncAnthropicProvider("ant-fake", "claude-haiku", 0.7, 4096)
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock()
+    provider.client = mock_client
+    return provider, mock_client
+
+
 @pytest.fixture
 def mock_generator(max_tokens=4096):
-    """Create a mocked TestDataGenerator for CLI tests."""
-    gen = MagicMock()
-    gen.config.max_tokens = max_tokens
-    gen.provider.max_tokens = max_tokens
+    """Create a real TestDataGenerator with a fake config for CLI tests.
+
+    Built via __new__ so no environment lookup or provider construction
+    happens; the lazy slots start empty exactly as after __init__. The
+    config is a real (frozen) AIProviderConfig so code under test can run
+    dataclasses.replace on it, and reconfigure() behaves for real.
+    Deliberately function-scoped: _adjust_max_tokens tests reassign
+    gen.config per test.
+    """
+    from testdata_ai.generator import TestDataGenerator
+
+    gen = TestDataGenerator.__new__(TestDataGenerator)
+    gen.config = config_module.AIProviderConfig(
+        provider="openai", api_key="sk-test", model="test-model", max_tokens=max_tokens
+    )
+    gen._aprovider = None
+    gen._pool = None
+    gen._provider = None
+    gen._generate = None
     return gen
 
 
-@pytest.fixture
+# ContextSchema is frozen, so the same instance can be shared read-only
+# across the session.
+@pytest.fixture(scope="session")
 def mock_context_schema():
     """Create a test ContextSchema for CLI tests."""
     return ContextSchema(
@@ -1,13 +1,17 @@
 """Tests for testdata_ai.ai_providers — provider factory, OpenAI, Anthropic."""
 
-from unittest.mock import patch, MagicMock
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 
 from testdata_ai.ai_providers import (
     OpenAIProvider,
     AnthropicProvider,
+    AsyncOpenAIProvider,
+    AsyncAnthropicProvider,
     get_provider,
+    get_async_provider,
     DEFAULT_SYSTEM_PROMPT,
 )
 
@@ -234,3 +238,524 @@ class TestAnthropicProvider:
         assert call_kwargs["model"] == "claude-haiku"
         assert call_kwargs["temperature"] == 0.7
         assert call_kwargs["max_tokens"] == 4096
+
+
+class TestGetAsyncProvider:
+
+    def test_returns_async_openai_provider(self):
+        with patch.object(AsyncOpenAIProvider, "_init_client"):
+            provider = get_async_provider("openai", "sk-key", "gpt-4o-mini", 0.7, 4096)
+        assert isinstance(provider, AsyncOpenAIProvider)
+
+    def test_returns_async_anthropic_provider(self):
+        with patch.object(AsyncAnthropicProvider, "_init_client"):
+            provider = get_async_provider("anthropic", "ant-key", "claude-haiku", 0.7, 4096)
+        assert isinstance(provider, AsyncAnthropicProvider)
+
+    def test_raises_for_unknown_provider(self):
+        with pytest.raises(ValueError, match="Unsupported provider: 'mistral'"):
+            get_async_provider("mistral", "key", "model", 0.7, 4096)
+
+
+class TestAsyncOpenAIProvider:
+
+    def test_generate_success(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content='{"data": []}'))]
+        )
+
+        result = asyncio.run(provider.generate("test prompt"))
+        assert result == '{"data": []}'
+        mock_client.chat.completions.create.assert_awaited_once()
+
+    def test_generate_includes_system_prompt(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="{}"))]
+        )
+
+        asyncio.run(provider.generate("test prompt", system_prompt="custom system"))
+        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["messages"][0] == {"role": "system", "content": "custom system"}
+
+    def test_generate_raises_on_api_error(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+        mock_client.chat.completions.create.side_effect = Exception("rate limit")
+
+        with pytest.raises(RuntimeError, match="Failed to generate data with OpenAI"):
+            asyncio.run(provider.generate("test prompt"))
+
+    def test_generate_raises_on_empty_response(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=None))]
+        )
+
+        with pytest.raises(RuntimeError, match="empty response"):
+            asyncio.run(provider.generate("test prompt"))
+
+
+class TestAsyncAnthropicProvider:
+
+    def test_generate_success(self, async_anthropic_provider_mock):
+        provider, mock_client = async_anthropic_provider_mock
+        mock_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text='{"data": []}')]
+        )
+
+        result = asyncio.run(provider.generate("test prompt"))
+        assert result == '{"data": []}'
+        mock_client.messages.create.assert_awaited_once()
+
+    def test_generate_raises_on_api_error(self, async_anthropic_provider_mock):
+        provider, mock_client = async_anthropic_provider_mock
+        mock_client.messages.create.side_effect = Exception("server error")
+
+        with pytest.raises(RuntimeError, match="Failed to generate data with Anthropic"):
+            asyncio.run(provider.generate("test prompt"))
+
+    def test_generate_raises_on_empty_response(self, async_anthropic_provider_mock):
+        provider, mock_client = async_anthropic_provider_mock
+        mock_client.messages.create.return_value = MagicMock(content=[])
+
+        with pytest.raises(RuntimeError, match="empty response"):
+            asyncio.run(provider.generate("test prompt"))
+
+
+class TestRateLimiter:
+
+    def test_defaults(self):
+        from testdata_ai.ai_providers import RateLimiter
+        limiter = RateLimiter()
+        assert limiter.max_concurrency == 8
+        assert limiter.rpm is None
+
+    def test_invalid_max_concurrency_raises(self):
+        from testdata_ai.ai_providers import RateLimiter
+        with pytest.raises(ValueError, match="max_concurrency"):
+            RateLimiter(max_concurrency=0)
+
+    def test_invalid_rpm_raises(self):
+        from testdata_ai.ai_providers import RateLimiter
+        with pytest.raises(ValueError, match="rpm"):
+            RateLimiter(rpm=0)
+
+    def test_bounds_concurrency(self):
+        from testdata_ai.ai_providers import RateLimiter
+
+        limiter = RateLimiter(max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def task():
+            nonlocal in_flight, max_in_flight
+            async with limiter:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+        async def main():
+            await asyncio.wait_for(
+                asyncio.gather(*(task() for _ in range(10))), timeout=5.0
+            )
+
+        asyncio.run(main())
+        assert max_in_flight <= 2
+
+    def test_rpm_window_records_timestamps(self):
+        from testdata_ai.ai_providers import RateLimiter
+
+        limiter = RateLimiter(max_concurrency=4, rpm=100)
+
+        async def task():
+            async with limiter:
+                pass
+
+        async def main():
+            await asyncio.gather(task(), task(), task())
+
+        asyncio.run(main())
+        assert len(limiter._timestamps) == 3
+
+
+class TestAsyncProviderRateLimiting:
+
+    def test_generate_runs_under_limiter(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+
+        async def assert_limiter_held(**kwargs):
+            # The semaphore slot must be taken while the API call runs.
+            assert provider.limiter._sem.locked() or \
+                provider.limiter._sem._value < provider.limiter.max_concurrency
+            return MagicMock(choices=[MagicMock(message=MagicMock(content="{}"))])
+
+        mock_client.chat.completions.create = AsyncMock(side_effect=assert_limiter_held)
+        asyncio.run(provider.generate("test"))
+
+    def test_factory_forwards_limits(self):
+        with patch.object(AsyncOpenAIProvider, "_init_client"):
+            provider = get_async_provider(
+                "openai", "sk-key", "gpt-4o-mini", 0.7, 4096,
+                max_concurrency=3, rpm=60,
+            )
+        assert provider.limiter.max_concurrency == 3
+        assert provider.limiter.rpm == 60
+
+
+def _set_openai_stream(mock_client, deltas):
+    """Configure mock_client to stream chat completion chunks with given deltas."""
+    chunks = [
+        MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+        for delta in deltas
+    ]
+    mock_client.chat.completions.create.return_value = iter(chunks)
+
+
+class TestOpenAIProviderStream:
+
+    def test_stream_yields_deltas(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        _set_openai_stream(mock_client, ['{"data": ', '[{"a": 1}]', "}"])
+
+        assert list(provider.stream("test prompt")) == [
+            '{"data": ', '[{"a": 1}]', "}"
+        ]
+
+    def test_stream_passes_stream_flag(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        _set_openai_stream(mock_client, ["{}"])
+
+        list(provider.stream("test prompt"))
+        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+
+    def test_stream_skips_empty_deltas(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        _set_openai_stream(mock_client, [None, "{}", None])
+
+        assert list(provider.stream("test prompt")) == ["{}"]
+
+    def test_stream_skips_chunks_without_choices(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        chunks = [
+            MagicMock(choices=[]),
+            MagicMock(choices=[MagicMock(delta=MagicMock(content="{}"))]),
+        ]
+        mock_client.chat.completions.create.return_value = iter(chunks)
+
+        assert list(provider.stream("test prompt")) == ["{}"]
+
+    def test_stream_raises_on_api_error(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.chat.completions.create.side_effect = Exception("rate limit")
+
+        with pytest.raises(RuntimeError, match="Failed to generate data with OpenAI"):
+            list(provider.stream("test prompt"))
+
+
+def _set_anthropic_stream(mock_client, texts):
+    """Configure mock_client to stream message text chunks."""
+    stream_cm = mock_client.messages.stream.return_value
+    stream_cm.__enter__.return_value = MagicMock(text_stream=iter(texts))
+
+
+class TestAnthropicProviderStream:
+
+    def test_stream_yields_text_chunks(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        _set_anthropic_stream(mock_client, ['{"data": ', "[]}"])
+
+        assert list(provider.stream("test prompt")) == ['{"data": ', "[]}"]
+
+    def test_stream_passes_model_and_system(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        _set_anthropic_stream(mock_client, ["{}"])
+
+        list(provider.stream("test prompt"))
+        call_kwargs = mock_client.messages.stream.call_args[1]
+        assert call_kwargs["model"] == provider.model
+        assert call_kwargs["system"] == DEFAULT_SYSTEM_PROMPT
+        assert call_kwargs["messages"] == [{"role": "user", "content": "test prompt"}]
+
+    def test_stream_raises_on_api_error(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        mock_client.messages.stream.side_effect = Exception("overloaded")
+
+        with pytest.raises(RuntimeError, match="Failed to generate data with Anthropic"):
+            list(provider.stream("test prompt"))
+
+
+class TestOpenAIProviderBatch:
+
+    def test_submit_batch_uploads_jsonl_and_creates_batch(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(id="batch-1")
+
+        batch_id = provider.submit_batch(["prompt one", "prompt two"])
+
+        assert batch_id == "batch-1"
+        file_kwargs = mock_client.files.create.call_args[1]
+        assert file_kwargs["purpose"] == "batch"
+        import json as json_mod
+        lines = [
+            json_mod.loads(line)
+            for line in file_kwargs["file"].getvalue().decode().splitlines()
+        ]
+        assert [line["custom_id"] for line in lines] == ["request-0", "request-1"]
+        assert lines[0]["body"]["messages"][-1]["content"] == "prompt one"
+        batch_kwargs = mock_client.batches.create.call_args[1]
+        assert batch_kwargs["input_file_id"] == "file-in"
+
+    def test_await_batch_polls_until_completed(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.batches.retrieve.side_effect = [
+            MagicMock(status="in_progress"),
+            MagicMock(status="completed", output_file_id="file-out"),
+        ]
+        import json as json_mod
+        lines = [
+            json_mod.dumps({
+                "custom_id": f"request-{i}",
+                "error": None,
+                "response": {
+                    "body": {
+                        "choices": [{"message": {"content": f"response-{i}"}}]
+                    }
+                },
+            })
+            for i in (1, 0)  # out of order on purpose
+        ]
+        mock_client.files.content.return_value = MagicMock(text="\n".join(lines))
+
+        results = provider.await_batch("batch-1", poll_interval=0)
+
+        assert results == ["response-0", "response-1"]
+        assert mock_client.batches.retrieve.call_count == 2
+
+    def test_await_batch_raises_on_failed_status(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.batches.retrieve.return_value = MagicMock(status="failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            provider.await_batch("batch-1", poll_interval=0)
+
+    def test_await_batch_raises_on_timeout(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.batches.retrieve.return_value = MagicMock(status="in_progress")
+
+        with pytest.raises(RuntimeError, match="did not complete"):
+            provider.await_batch("batch-1", poll_interval=0, timeout=0.01)
+
+    def test_submit_batch_raises_on_api_error(self, openai_provider_mock):
+        provider, mock_client = openai_provider_mock
+        mock_client.files.create.side_effect = Exception("quota")
+
+        with pytest.raises(RuntimeError, match="Failed to submit OpenAI batch"):
+            provider.submit_batch(["prompt"])
+
+
+class TestAnthropicProviderBatch:
+
+    def _result_entry(self, i):
+        return MagicMock(
+            custom_id=f"request-{i}",
+            result=MagicMock(
+                type="succeeded",
+                message=MagicMock(content=[MagicMock(text=f"response-{i}")]),
+            ),
+        )
+
+    def test_submit_batch_creates_message_batch(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        mock_client.messages.batches.create.return_value = MagicMock(id="batch-1")
+
+        batch_id = provider.submit_batch(["prompt one", "prompt two"])
+
+        assert batch_id == "batch-1"
+        requests = mock_client.messages.batches.create.call_args[1]["requests"]
+        assert [r["custom_id"] for r in requests] == ["request-0", "request-1"]
+        assert requests[0]["params"]["messages"] == [
+            {"role": "user", "content": "prompt one"}
+        ]
+        assert requests[0]["params"]["system"] == DEFAULT_SYSTEM_PROMPT
+
+    def test_await_batch_polls_and_orders_results(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        mock_client.messages.batches.retrieve.side_effect = [
+            MagicMock(processing_status="in_progress"),
+            MagicMock(processing_status="ended"),
+        ]
+        mock_client.messages.batches.results.return_value = iter(
+            [self._result_entry(1), self._result_entry(0)]
+        )
+
+        results = provider.await_batch("batch-1", poll_interval=0)
+
+        assert results == ["response-0", "response-1"]
+
+    def test_await_batch_raises_on_errored_request(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        mock_client.messages.batches.retrieve.return_value = MagicMock(
+            processing_status="ended"
+        )
+        mock_client.messages.batches.results.return_value = iter(
+            [MagicMock(custom_id="request-0", result=MagicMock(type="errored"))]
+        )
+
+        with pytest.raises(RuntimeError, match="request-0 errored"):
+            provider.await_batch("batch-1", poll_interval=0)
+
+
+class TestMultiKeyRoundRobin:
+
+    @staticmethod
+    def _fake_init(self, api_key):
+        self.client = MagicMock()
+        self.client.key = api_key
+
+    def _make_provider(self, api_keys):
+        with patch.object(OpenAIProvider, "_init_client", self._fake_init):
+            return OpenAIProvider(
+                api_keys[0], "gpt-4o-mini", 0.7, 4096, api_keys=api_keys
+            )
+
+    def test_single_key_reuses_one_client(self):
+        with patch.object(OpenAIProvider, "_init_client", self._fake_init):
+            provider = OpenAIProvider("sk-a", "gpt-4o-mini", 0.7, 4096)
+        assert provider._rr is None
+        assert provider._next_client() is provider.client
+        assert provider._next_client() is provider.client
+
+    def test_multiple_keys_rotate_round_robin(self):
+        provider = self._make_provider(["sk-a", "sk-b"])
+        keys = [provider._next_client().key for _ in range(4)]
+        assert keys == ["sk-a", "sk-b", "sk-a", "sk-b"]
+
+    def test_generate_alternates_between_clients(self):
+        provider = self._make_provider(["sk-a", "sk-b"])
+        clients = [provider._next_client() for _ in range(2)]
+        for client in clients:
+            _set_openai_response(client, "{}")
+
+        provider.generate("prompt")
+        provider.generate("prompt")
+
+        for client in clients:
+            client.chat.completions.create.assert_called_once()
+
+    def test_factory_forwards_api_keys(self):
+        with patch.object(OpenAIProvider, "_init_client", self._fake_init):
+            provider = get_provider(
+                "openai", "sk-a", "gpt-4o-mini", 0.7, 4096,
+                api_keys=("sk-a", "sk-b", "sk-c"),
+            )
+        keys = {provider._next_client().key for _ in range(3)}
+        assert keys == {"sk-a", "sk-b", "sk-c"}
+
+
+class TestAnthropicToolUseJson:
+
+    def test_generate_forces_tool_choice(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        _set_anthropic_response(mock_client, "{}")
+
+        provider.generate("test prompt")
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert call_kwargs["tool_choice"] == {
+            "type": "tool", "name": "emit_records"
+        }
+        assert call_kwargs["tools"][0]["name"] == "emit_records"
+
+    def test_generate_serializes_tool_use_input(self, anthropic_provider_mock):
+        import json as json_mod
+        provider, mock_client = anthropic_provider_mock
+        block = MagicMock(type="tool_use", input={"data": [{"name": "Test"}]})
+        mock_client.messages.create.return_value = MagicMock(content=[block])
+
+        result = provider.generate("test prompt")
+        assert json_mod.loads(result) == {"data": [{"name": "Test"}]}
+
+    def test_generate_falls_back_to_text_block(self, anthropic_provider_mock):
+        provider, mock_client = anthropic_provider_mock
+        block = MagicMock(type="text")
+        block.text = '{"data": []}'
+        mock_client.messages.create.return_value = MagicMock(content=[block])
+
+        assert provider.generate("test prompt") == '{"data": []}'
+
+    def test_generate_freeform_omits_forced_tool(self, anthropic_provider_mock):
+        """generate_freeform must not constrain the response shape."""
+        provider, mock_client = anthropic_provider_mock
+        _set_anthropic_response(mock_client, '{"banking_user": []}')
+
+        result = provider.generate_freeform("test prompt")
+        assert result == '{"banking_user": []}'
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert "tools" not in call_kwargs
+        assert "tool_choice" not in call_kwargs
+
+    def test_generate_freeform_raises_on_empty_response(
+        self, anthropic_provider_mock
+    ):
+        provider, mock_client = anthropic_provider_mock
+        mock_client.messages.create.return_value = MagicMock(content=[])
+
+        with pytest.raises(RuntimeError, match="empty response"):
+            provider.generate_freeform("test prompt")
+
+
+class TestBuildOpenAIMessages:
+
+    def test_default_system_prompt_reuses_shared_message(self, openai_provider_mock):
+        from testdata_ai.ai_providers import _OPENAI_SYS_MSG
+        provider, mock_client = openai_provider_mock
+        _set_openai_response(mock_client, "{}")
+
+        provider.generate("one")
+        provider.generate("two")
+        for call in mock_client.chat.completions.create.call_args_list:
+            assert call[1]["messages"][0] is _OPENAI_SYS_MSG
+
+    def test_custom_system_prompt_builds_fresh_message(self, openai_provider_mock):
+        from testdata_ai.ai_providers import _OPENAI_SYS_MSG
+        provider, mock_client = openai_provider_mock
+        _set_openai_response(mock_client, "{}")
+
+        provider.generate("one", system_prompt="custom")
+        messages = mock_client.chat.completions.create.call_args[1]["messages"]
+        assert messages[0] == {"role": "system", "content": "custom"}
+        assert messages[0] is not _OPENAI_SYS_MSG
+
+
+class TestAsyncProviderRetries:
+
+    def test_openai_retries_on_429(self, async_openai_provider_mock):
+        provider, mock_client = async_openai_provider_mock
+        error = Exception("rate limited")
+        error.status_code = 429
+        error.response = MagicMock(headers={})
+        ok = MagicMock(choices=[MagicMock(message=MagicMock(content="{}"))])
+        mock_client.chat.completions.create = AsyncMock(side_effect=[error, ok])
+
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()):
+            result = asyncio.run(provider.generate("prompt"))
+
+        assert result == "{}"
+        assert mock_client.chat.completions.create.await_count == 2
+
+    def test_anthropic_gives_up_after_max_attempts(self, async_anthropic_provider_mock):
+        provider, mock_client = async_anthropic_provider_mock
+        error = Exception("overloaded")
+        error.status_code = 503
+        error.response = MagicMock(headers={})
+        mock_client.messages.create = AsyncMock(side_effect=error)
+
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(RuntimeError, match="Failed to generate data"):
+                asyncio.run(provider.generate("prompt"))
+
+        assert mock_client.messages.create.await_count == 5
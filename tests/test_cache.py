@@ -0,0 +1,78 @@
+"""Tests for testdata_ai.cache — exact-match LLM response cache."""
+
+import pytest
+
+from testdata_ai.cache import LLMCache, cache_enabled, get_response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    """Keep the process-wide cache from leaking state between tests."""
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
+
+
+class TestLLMCache:
+
+    def test_get_returns_none_on_miss(self):
+        cache = LLMCache()
+        assert cache.get("missing") is None
+
+    def test_set_then_get_round_trips(self):
+        cache = LLMCache()
+        cache.set("k", '{"data": []}')
+        assert cache.get("k") == '{"data": []}'
+
+    def test_evicts_least_recently_used(self):
+        cache = LLMCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # refresh "a" so "b" is oldest
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_clear_empties_cache(self):
+        cache = LLMCache()
+        cache.set("k", "v")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get("k") is None
+
+    def test_raises_for_invalid_maxsize(self):
+        with pytest.raises(ValueError, match="maxsize must be >= 1"):
+            LLMCache(maxsize=0)
+
+    def test_make_key_is_deterministic(self):
+        key1 = LLMCache.make_key("openai", "gpt-4o-mini", 0.0, "sys", "prompt")
+        key2 = LLMCache.make_key("openai", "gpt-4o-mini", 0.0, "sys", "prompt")
+        assert key1 == key2
+
+    def test_make_key_varies_with_parameters(self):
+        base = LLMCache.make_key("openai", "gpt-4o-mini", 0.0, "sys", "prompt")
+        assert LLMCache.make_key("anthropic", "gpt-4o-mini", 0.0, "sys", "prompt") != base
+        assert LLMCache.make_key("openai", "gpt-4o", 0.0, "sys", "prompt") != base
+        assert LLMCache.make_key("openai", "gpt-4o-mini", 0.5, "sys", "prompt") != base
+        assert LLMCache.make_key("openai", "gpt-4o-mini", 0.0, "sys", "other") != base
+
+
+class TestCacheEnabled:
+
+    def test_enabled_at_temperature_zero(self):
+        assert cache_enabled(0.0) is True
+
+    def test_disabled_at_nonzero_temperature(self, monkeypatch):
+        monkeypatch.delenv("TESTDATA_CACHE_NONDETERMINISTIC", raising=False)
+        assert cache_enabled(0.7) is False
+
+    def test_env_flag_enables_nondeterministic_caching(self, monkeypatch):
+        monkeypatch.setenv("TESTDATA_CACHE_NONDETERMINISTIC", "1")
+        assert cache_enabled(0.7) is True
+
+
+class TestSharedCache:
+
+    def test_get_response_cache_is_singleton(self):
+        assert get_response_cache() is get_response_cache()
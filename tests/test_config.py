@@ -143,3 +143,137 @@ class TestGetProviderConfig:
         monkeypatch.setenv("OPENAI_MAX_TOKENS", "xyz")
         with pytest.raises(ValueError):
             get_provider_config("openai")
+
+
+@pytest.mark.usefixtures("clean_ai_env_fixture")
+class TestRateLimitConfig:
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        cfg = get_provider_config("openai")
+        assert cfg.max_concurrency == 8
+        assert cfg.rpm is None
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("OPENAI_MAX_CONCURRENCY", "4")
+        monkeypatch.setenv("OPENAI_RPM", "500")
+        cfg = get_provider_config("openai")
+        assert cfg.max_concurrency == 4
+        assert cfg.rpm == 500
+
+    def test_invalid_max_concurrency_raises(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AIProviderConfig(
+                provider="openai", api_key="k", model="m", max_concurrency=0
+            )
+
+    def test_invalid_rpm_raises(self):
+        with pytest.raises(ValueError, match="rpm"):
+            AIProviderConfig(provider="openai", api_key="k", model="m", rpm=-5)
+
+
+class TestMultiKeyConfig:
+
+    def test_api_keys_defaults_to_single_key(self):
+        config = AIProviderConfig(
+            provider="openai", api_key="sk-a", model="gpt-4o-mini"
+        )
+        assert config.api_keys == ("sk-a",)
+
+    def test_explicit_api_keys_are_preserved(self):
+        config = AIProviderConfig(
+            provider="openai", api_key="sk-a", model="gpt-4o-mini",
+            api_keys=("sk-a", "sk-b"),
+        )
+        assert config.api_keys == ("sk-a", "sk-b")
+
+    def test_raises_for_empty_key_in_list(self):
+        with pytest.raises(ValueError, match="empty keys"):
+            AIProviderConfig(
+                provider="openai", api_key="sk-a", model="gpt-4o-mini",
+                api_keys=("sk-a", "  "),
+            )
+
+    def test_from_env_parses_comma_separated_keys(self, clean_ai_env_fixture, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-a")
+        monkeypatch.setenv("OPENAI_API_KEYS", "sk-a, sk-b,sk-c")
+        config = get_provider_config("openai")
+        assert config.api_keys == ("sk-a", "sk-b", "sk-c")
+
+    def test_from_env_falls_back_to_first_of_api_keys(self, clean_ai_env_fixture, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setenv("OPENAI_API_KEYS", "sk-a,sk-b")
+        config = get_provider_config("openai")
+        assert config.api_key == "sk-a"
+
+
+class TestConfigSlots:
+
+    def test_config_has_no_instance_dict(self):
+        config = AIProviderConfig(
+            provider="openai", api_key="sk-a", model="gpt-4o-mini"
+        )
+        assert not hasattr(config, "__dict__")
+
+    def test_unknown_attribute_assignment_raises(self):
+        config = AIProviderConfig(
+            provider="openai", api_key="sk-a", model="gpt-4o-mini"
+        )
+        # On some interpreters a frozen+slots dataclass raises TypeError
+        # here instead of AttributeError (the generated __setattr__'s
+        # zero-arg super breaks when slots=True rebuilds the class).
+        with pytest.raises((AttributeError, TypeError)):
+            config.unknown_setting = 1
+
+    def test_field_assignment_raises_frozen_error(self):
+        config = AIProviderConfig(
+            provider="openai", api_key="sk-a", model="gpt-4o-mini"
+        )
+        with pytest.raises(AttributeError):
+            config.max_tokens = 1
+
+
+class TestParseEnvCache:
+
+    def test_repeated_calls_return_equal_fresh_configs(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        first = get_provider_config("openai")
+        second = get_provider_config("openai")
+        assert first == second
+        assert first is not second  # CLI mutates max_tokens; never shared
+
+    def test_env_change_invalidates_cache(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("OPENAI_MAX_TOKENS", "1000")
+        assert get_provider_config("openai").max_tokens == 1000
+        monkeypatch.setenv("OPENAI_MAX_TOKENS", "2000")
+        assert get_provider_config("openai").max_tokens == 2000
+
+
+@pytest.mark.usefixtures("clean_ai_env_fixture")
+class TestFromOverrides:
+
+    def test_no_overrides_matches_env_config(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        config = AIProviderConfig.from_overrides("openai")
+        assert config == get_provider_config("openai")
+
+    def test_overrides_win_over_env(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+        config = AIProviderConfig.from_overrides(
+            "openai", model="gpt-4o", max_tokens=8192, temperature=0.2
+        )
+        assert config.model == "gpt-4o"
+        assert config.max_tokens == 8192
+        assert config.temperature == 0.2
+
+    def test_invalid_override_raises(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        with pytest.raises(ValueError, match="temperature"):
+            AIProviderConfig.from_overrides("openai", temperature=3.0)
+
+    def test_missing_api_key_raises(self):
+        with pytest.raises(ValueError, match="API key not found"):
+            AIProviderConfig.from_overrides("openai")
@@ -89,20 +89,13 @@ class TestBuiltinContexts:
     ALL_CONTEXT_NAMES = list(CONTEXTS.keys())
 
     @pytest.mark.parametrize("name", ALL_CONTEXT_NAMES)
-    def test_schema_has_nonempty_description(self, name):
-        assert CONTEXTS[name].description
-
-    @pytest.mark.parametrize("name", ALL_CONTEXT_NAMES)
-    def test_schema_has_nonempty_sample(self, name):
-        assert CONTEXTS[name].sample
-
-    @pytest.mark.parametrize("name", ALL_CONTEXT_NAMES)
-    def test_schema_has_prompt_hints(self, name):
-        assert CONTEXTS[name].prompt_hints
-
-    @pytest.mark.parametrize("name", ALL_CONTEXT_NAMES)
-    def test_schema_has_category(self, name):
-        assert CONTEXTS[name].category
+    def test_schema_is_wellformed(self, name):
+        """Every schema attribute is populated; one item per context."""
+        schema = CONTEXTS[name]
+        assert schema.description, name
+        assert schema.sample, name
+        assert schema.prompt_hints, name
+        assert schema.category, name
 
     @pytest.mark.parametrize("name", ALL_CONTEXT_NAMES)
     def test_sample_validates_against_own_schema(self, name):
@@ -146,38 +139,36 @@ class TestListContexts:
 
 class TestValidateGeneratedData:
 
-    def test_all_valid_returns_empty_list(self):
-        sample = CONTEXTS["banking_user"].sample
-        assert validate_generated_data("banking_user", [sample, sample]) == []
-
-    def test_detects_missing_fields(self):
-        incomplete = {"name": "Test"}  # missing many fields
-        result = validate_generated_data("banking_user", [incomplete])
-        assert len(result) == 1
-        assert result[0]["record_index"] == 0
+    _BANKING = CONTEXTS["banking_user"].sample
+    _SAAS = CONTEXTS["saas_trial"].sample
+
+    @pytest.mark.parametrize(
+        "ctx,records,expected_bad_indices",
+        [
+            pytest.param("banking_user", [_BANKING, _BANKING], [], id="all_valid"),
+            pytest.param("banking_user", [{"name": "Test"}], [0], id="missing_fields"),
+            pytest.param("saas_trial", [_SAAS, {"name": "X"}, _SAAS], [1], id="mixed"),
+            pytest.param("ecommerce_customer", [], [], id="empty_list"),
+            pytest.param("banking_user", ["not a dict"], [0], id="non_dict"),
+        ],
+    )
+    def test_validate(self, ctx, records, expected_bad_indices):
+        result = validate_generated_data(ctx, records)
+        assert [r["record_index"] for r in result] == expected_bad_indices
+
+    def test_reports_which_fields_are_missing(self):
+        result = validate_generated_data("banking_user", [{"name": "Test"}])
         assert "email" in result[0]["missing_fields"]
 
-    def test_mixed_valid_and_invalid(self):
-        sample = CONTEXTS["saas_trial"].sample
-        bad = {"name": "X"}
-        result = validate_generated_data("saas_trial", [sample, bad, sample])
-        assert len(result) == 1
-        assert result[0]["record_index"] == 1
-
-    def test_empty_records_list(self):
-        assert validate_generated_data("ecommerce_customer", []) == []
-
-    def test_raises_for_unknown_context(self):
-        with pytest.raises(ValueError):
-            validate_generated_data("fake_context", [{}])
-
     def test_non_dict_record_reports_all_fields_missing(self):
         """A non-dict record (e.g. string) should report all fields missing."""
         result = validate_generated_data("banking_user", ["not a dict"])
-        assert len(result) == 1
-        assert result[0]["record_index"] == 0
         assert len(result[0]["missing_fields"]) == len(CONTEXTS["banking_user"].fields)
 
+    def test_raises_for_unknown_context(self):
+        with pytest.raises(ValueError):
+            validate_generated_data("fake_context", [{}])
+
 
 class TestValidationError:
 
@@ -210,3 +201,40 @@ class TestValidationError:
     def test_is_subclass_of_value_error(self):
         err = ValidationError([])
         assert isinstance(err, ValueError)
+
+
+class TestPrecomputedFields:
+
+    def test_fields_property_still_returns_list(self):
+        schema = ContextSchema(
+            description="things", sample={"a": 1, "b": 2}, prompt_hints=[]
+        )
+        assert schema.fields == ["a", "b"]
+
+    def test_validate_record_uses_prebuilt_set(self):
+        schema = ContextSchema(
+            description="things", sample={"a": 1, "b": 2}, prompt_hints=[]
+        )
+        assert schema.validate_record({"a": 1, "b": 2, "extra": 3}) is True
+        assert schema.validate_record({"a": 1}) is False
+
+    def test_fields_preserve_sample_order(self):
+        sample = {"z": 1, "a": 2, "m": 3}
+        schema = ContextSchema(description="x", sample=sample, prompt_hints=[])
+        assert schema.fields == ["z", "a", "m"]
+
+
+class TestSchemaImmutability:
+
+    def test_schema_is_frozen(self):
+        schema = get_context_schema("banking_user")
+        with pytest.raises(AttributeError):
+            schema.category = "other"
+
+    def test_schema_has_no_dict(self):
+        schema = get_context_schema("banking_user")
+        assert not hasattr(schema, "__dict__")
+
+    def test_contexts_mapping_is_read_only(self):
+        with pytest.raises(TypeError):
+            CONTEXTS["new_context"] = CONTEXTS["banking_user"]
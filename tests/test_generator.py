@@ -6,89 +6,106 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from testdata_ai.config import AIProviderConfig
 from testdata_ai.contexts import CONTEXTS, ValidationError
 from testdata_ai.generator import TestDataGenerator, _strip_markdown_fences, generate
 
+# Fixed provider responses rendered once at import instead of
+# json.dumps-ing the same sample payloads inside each test body.
+_SAMPLE_BANKING = CONTEXTS["banking_user"].sample
+_BANKING_RESPONSE = json.dumps({"data": [_SAMPLE_BANKING]})
+_SAAS_RESPONSE = json.dumps({"data": [CONTEXTS["saas_trial"].sample]})
 
-class TestStripMarkdownFences:
-
-    def test_plain_json_unchanged(self):
-        text = '{"data": [1, 2, 3]}'
-        assert _strip_markdown_fences(text) == text
-
-    def test_strips_json_fence(self):
-        text = '```json\n{"a": 1}\n```'
-        assert _strip_markdown_fences(text) == '{"a": 1}'
-
-    def test_strips_uppercase_json_fence(self):
-        text = '```JSON\n{"a": 1}\n```'
-        assert _strip_markdown_fences(text) == '{"a": 1}'
-
-    def test_strips_bare_fence(self):
-        text = '```\n[1, 2, 3]\n```'
-        assert _strip_markdown_fences(text) == '[1, 2, 3]'
-
-    def test_strips_fence_with_trailing_whitespace(self):
-        text = '```json\n{"x": 1}\n```  \n'
-        assert _strip_markdown_fences(text) == '{"x": 1}'
-
-    def test_preserves_whitespace_inside_json(self):
-        inner = '{\n  "a": 1,\n  "b": 2\n}'
-        text = f"```json\n{inner}\n```"
-        assert _strip_markdown_fences(text) == inner
 
-    def test_strips_missing_closing_fence(self):
-        text = '```json\n{"a": 1}'  # missing closing fence
-        assert _strip_markdown_fences(text) == '{"a": 1}'
-
-    def test_strips_missing_opening_fence(self):
-        text = '[1, 2, 3]\n```'  # missing opening fence
-        assert _strip_markdown_fences(text) == '[1, 2, 3]'
-
-    def test_empty_string(self):
-        assert _strip_markdown_fences("") == ""
+class TestStripMarkdownFences:
 
-    def test_whitespace_only(self):
-        assert _strip_markdown_fences("   \n  ") == ""
+    _INNER = '{\n  "a": 1,\n  "b": 2\n}'
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ('{"data": [1, 2, 3]}', '{"data": [1, 2, 3]}'),
+            ('```json\n{"a": 1}\n```', '{"a": 1}'),
+            ('```JSON\n{"a": 1}\n```', '{"a": 1}'),
+            ('```\n[1, 2, 3]\n```', '[1, 2, 3]'),
+            ('```json\n{"x": 1}\n```  \n', '{"x": 1}'),
+            (f"```json\n{_INNER}\n```", _INNER),
+            ('```json\n{"a": 1}', '{"a": 1}'),
+            ('[1, 2, 3]\n```', '[1, 2, 3]'),
+            ("", ""),
+            ("   \n  ", ""),
+            (
+                '{"note": "use ``` for code blocks"}',
+                '{"note": "use ``` for code blocks"}',
+            ),
+        ],
+        ids=[
+            "plain",
+            "json_fence",
+            "uppercase_fence",
+            "bare_fence",
+            "trailing_ws",
+            "inner_ws",
+            "missing_close",
+            "missing_open",
+            "empty",
+            "ws_only",
+            "inner_backticks",
+        ],
+    )
+    def test_strip(self, text, expected):
+        assert _strip_markdown_fences(text) == expected
+
+
+def _bare_generator():
+    """Build a TestDataGenerator without running __init__.
+
+    __init__ only resolves config from the environment and nulls the
+    lazy slots, so fixtures skip it (and the get_provider_config patch
+    it would need) and set the same attributes directly. The config
+    stays a per-call MagicMock because some tests mutate temperature.
+    """
+    gen = TestDataGenerator.__new__(TestDataGenerator)
+    gen.config = MagicMock(
+        provider="openai",
+        api_key="sk-fake",
+        model="test-model",
+        temperature=0.7,
+        max_tokens=4096,
+    )
+    gen._aprovider = None
+    gen._pool = None
+    gen._provider = None
+    gen._generate = None
+    return gen
 
 
 @pytest.fixture
 def make_generator():
     """Create a TestDataGenerator with a mocked AI provider.
 
-    The patches are only active during __init__; the returned generator keeps
-    references to the mock provider, so calls to gen.generate() still use
-    the mock even after the patch context exits.
+    The mock provider is injected through the provider setter, so calls
+    to gen.generate() use the mock and never build a real provider.
     """
     def _make(provider_response):
-        with patch("testdata_ai.generator.get_provider_config") as mock_config, \
-             patch("testdata_ai.generator.get_provider") as mock_get_prov:
-            mock_config.return_value = MagicMock(
-                provider="openai",
-                api_key="sk-fake",
-                model="test-model",
-                temperature=0.7,
-                max_tokens=4096,
-            )
-            mock_prov = MagicMock()
-            mock_prov.generate.return_value = provider_response
-            mock_get_prov.return_value = mock_prov
-
-            gen = TestDataGenerator()
-            return gen
+        gen = _bare_generator()
+        mock_prov = MagicMock()
+        mock_prov.generate.return_value = provider_response
+        # generate_contexts goes through the un-forced variant.
+        mock_prov.generate_freeform.return_value = provider_response
+        gen.provider = mock_prov
+        return gen
     return _make
 
 
 class TestTestDataGenerator:
 
     def test_generate_returns_list_of_dicts(self, make_generator):
-        sample = CONTEXTS["banking_user"].sample
-        response = json.dumps({"data": [sample]})
-        gen = make_generator(response)
+        gen = make_generator(_BANKING_RESPONSE)
         result = gen.generate("banking_user", count=1)
         assert isinstance(result, list)
         assert len(result) == 1
-        assert result[0]["name"] == sample["name"]
+        assert result[0]["name"] == _SAMPLE_BANKING["name"]
 
     def test_generate_normalizes_dict_with_data_key(self, make_generator):
         records = [{"name": "A"}, {"name": "B"}]
@@ -120,8 +137,7 @@ class TestTestDataGenerator:
         assert result == ["hello"]
 
     def test_generate_strips_markdown_fences(self, make_generator):
-        sample = CONTEXTS["saas_trial"].sample
-        response = f'```json\n{json.dumps({"data": [sample]})}\n```'
+        response = f"```json\n{_SAAS_RESPONSE}\n```"
         gen = make_generator(response)
         result = gen.generate("saas_trial", count=1)
         assert len(result) == 1
@@ -156,19 +172,32 @@ class TestTestDataGenerator:
         result = gen.generate("banking_user", count=1, validate=False)
         assert len(result) == 1
 
-    def test_generate_warns_when_count_exceeds_50(self, make_generator, caplog):
-        sample = CONTEXTS["banking_user"].sample
-        gen = make_generator(json.dumps({"data": [sample]}))
-        with caplog.at_level(logging.WARNING, logger="testdata_ai.generator"):
-            gen.generate("banking_user", count=51, validate=False)
-        assert "may exceed token limits" in caplog.text
-
-    def test_generate_warns_on_count_mismatch(self, make_generator, caplog):
-        records = [CONTEXTS["banking_user"].sample]
-        gen = make_generator(json.dumps({"data": records}))
-        with caplog.at_level(logging.WARNING, logger="testdata_ai.generator"):
-            gen.generate("banking_user", count=5, validate=False)
-        assert "Requested 5 records but received 1" in caplog.text
+    @staticmethod
+    def _warnings_emitted(action):
+        """Run action with logger.warning stubbed; return the messages.
+
+        Patching the method directly skips record construction, handler
+        locking and propagation — the tests only care that a warning
+        with a given substring was emitted.
+        """
+        logger = logging.getLogger("testdata_ai.generator")
+        with patch.object(logger, "warning") as mock_warn:
+            action()
+        return [str(call.args[0]) for call in mock_warn.call_args_list]
+
+    def test_generate_warns_when_count_exceeds_50(self, make_generator):
+        gen = make_generator(_BANKING_RESPONSE)
+        messages = self._warnings_emitted(
+            lambda: gen.generate("banking_user", count=51, validate=False)
+        )
+        assert any("may exceed token limits" in m for m in messages)
+
+    def test_generate_warns_on_count_mismatch(self, make_generator):
+        gen = make_generator(_BANKING_RESPONSE)
+        messages = self._warnings_emitted(
+            lambda: gen.generate("banking_user", count=5, validate=False)
+        )
+        assert any("Requested 5 records but received 1" in m for m in messages)
 
     def test_generate_dict_with_multiple_lists_uses_first(self, make_generator):
         """When dict has multiple list values, the first one is used."""
@@ -238,10 +267,48 @@ class TestGeneratorInit:
         assert gen.config.provider == "anthropic"
 
 
+class TestReconfigure:
+
+    @staticmethod
+    def _real_config_generator():
+        gen = _bare_generator()
+        gen.config = AIProviderConfig(
+            provider="openai", api_key="sk-fake", model="test-model", max_tokens=4096
+        )
+        return gen
+
+    def test_replaces_config_fields(self):
+        gen = self._real_config_generator()
+        gen.reconfigure(max_tokens=8192)
+        assert gen.config.max_tokens == 8192
+        assert gen.config.model == "test-model"
+
+    def test_drops_cached_providers(self):
+        """Old-config providers must be released, not mutated in place —
+        _cached_provider shares instances across generators."""
+        gen = self._real_config_generator()
+        stale = MagicMock(max_tokens=4096)
+        gen.provider = stale
+        gen._aprovider = MagicMock()
+        gen.reconfigure(max_tokens=8192)
+        assert gen._provider is None
+        assert gen._generate is None
+        assert gen._aprovider is None
+        assert stale.max_tokens == 4096
+
+
 class TestGenerateConvenienceFunction:
 
+    @pytest.fixture(autouse=True)
+    def reset_default_generator(self):
+        """Each test starts without a cached module-level generator."""
+        import testdata_ai.generator as generator_module
+        generator_module._default_generator = None
+        yield
+        generator_module._default_generator = None
+
     def test_calls_generator_and_returns_records(self):
-        sample = CONTEXTS["banking_user"].sample
+        sample = _SAMPLE_BANKING
         with patch("testdata_ai.generator.TestDataGenerator") as mock_cls:
             mock_instance = MagicMock()
             mock_instance.generate.return_value = [sample]
@@ -262,3 +329,419 @@ class TestGenerateConvenienceFunction:
             generate("ecommerce_customer")
 
         mock_instance.generate.assert_called_once_with("ecommerce_customer", 10)
+
+    def test_reuses_generator_across_calls(self):
+        with patch("testdata_ai.generator.TestDataGenerator") as mock_cls:
+            mock_cls.return_value.generate.return_value = []
+            generate("ecommerce_customer")
+            generate("banking_user")
+        mock_cls.assert_called_once_with()
+
+
+@pytest.fixture
+def make_async_generator():
+    """Create a TestDataGenerator whose async provider is mocked.
+
+    ``provider_responses`` is a list of raw response strings, one per
+    expected sub-batch call (cycled if more calls are made).
+    """
+    def _make(provider_responses):
+        from unittest.mock import AsyncMock
+        gen = _bare_generator()
+        mock_aprov = MagicMock()
+        mock_aprov.generate = AsyncMock(side_effect=list(provider_responses))
+        gen._aprovider = mock_aprov
+        return gen, mock_aprov
+    return _make
+
+
+class TestAgenerate:
+
+    def test_single_sub_batch(self, make_async_generator):
+        import asyncio
+        records = [{"name": "A"}, {"name": "B"}]
+        gen, mock_aprov = make_async_generator([json.dumps({"data": records})])
+        result = asyncio.run(gen.agenerate("ecommerce_customer", count=2, validate=False))
+        assert result == records
+        assert mock_aprov.generate.await_count == 1
+
+    def test_fans_out_into_sub_batches(self, make_async_generator):
+        import asyncio
+        responses = [
+            json.dumps({"data": [{"n": i}] * 5}) for i in range(2)
+        ] + [json.dumps({"data": [{"n": 2}] * 2})]
+        gen, mock_aprov = make_async_generator(responses)
+        result = asyncio.run(
+            gen.agenerate("ecommerce_customer", count=12, sub_batch=5, validate=False)
+        )
+        assert len(result) == 12
+        assert mock_aprov.generate.await_count == 3
+
+    def test_raises_on_invalid_json(self, make_async_generator):
+        import asyncio
+        gen, _ = make_async_generator(["not json"])
+        with pytest.raises(ValueError, match="not valid JSON"):
+            asyncio.run(gen.agenerate("ecommerce_customer", count=1))
+
+    def test_raises_when_count_less_than_1(self, make_async_generator):
+        import asyncio
+        gen, _ = make_async_generator(["{}"])
+        with pytest.raises(ValueError, match="count must be >= 1"):
+            asyncio.run(gen.agenerate("ecommerce_customer", count=0))
+
+    def test_raises_on_validation_failure(self, make_async_generator):
+        import asyncio
+        gen, _ = make_async_generator([json.dumps({"data": [{"name": "X"}]})])
+        with pytest.raises(ValidationError):
+            asyncio.run(gen.agenerate("banking_user", count=1))
+
+
+class TestIterJsonRecords:
+
+    def _collect(self, chunks):
+        from testdata_ai.generator import _iter_json_records
+        return list(_iter_json_records(chunks))
+
+    def test_parses_records_from_single_chunk(self):
+        text = '{"data": [{"a": 1}, {"b": 2}]}'
+        assert self._collect([text]) == [{"a": 1}, {"b": 2}]
+
+    def test_parses_records_split_across_chunks(self):
+        chunks = ['{"data": [{"a"', ': 1}, {"b', '": 2}]}']
+        assert self._collect(chunks) == [{"a": 1}, {"b": 2}]
+
+    def test_yields_record_before_stream_ends(self):
+        from testdata_ai.generator import _iter_json_records
+
+        def chunks():
+            yield '{"data": [{"a": 1}, '
+            raise RuntimeError("stream broke")
+
+        it = _iter_json_records(chunks())
+        assert next(it) == {"a": 1}
+        with pytest.raises(RuntimeError):
+            next(it)
+
+    def test_handles_nested_structures(self):
+        text = '{"data": [{"tags": ["x", "y"], "meta": {"depth": {"n": 1}}}]}'
+        assert self._collect([text]) == [
+            {"tags": ["x", "y"], "meta": {"depth": {"n": 1}}}
+        ]
+
+    def test_braces_inside_strings_are_ignored(self):
+        text = '{"data": [{"note": "braces } ] and \\" quote"}]}'
+        assert self._collect([text]) == [{"note": 'braces } ] and " quote'}]
+
+    def test_ignores_markdown_fences(self):
+        text = '```json\n{"data": [{"a": 1}]}\n```'
+        assert self._collect([text]) == [{"a": 1}]
+
+    def test_parses_bare_array(self):
+        assert self._collect(['[{"a": 1}]']) == [{"a": 1}]
+
+    def test_stops_at_array_close(self):
+        text = '{"data": [{"a": 1}], "extra": [{"b": 2}]}'
+        assert self._collect([text]) == [{"a": 1}]
+
+    def test_empty_stream_yields_nothing(self):
+        assert self._collect([]) == []
+
+
+class TestStream:
+
+    def _make_streaming(self, make_generator, chunks):
+        gen = make_generator("{}")
+        gen.provider.stream.return_value = iter(chunks)
+        return gen
+
+    def test_yields_records_incrementally(self, make_generator):
+        sample = _SAMPLE_BANKING
+        response = json.dumps({"data": [sample, sample]})
+        mid = len(response) // 2
+        gen = self._make_streaming(make_generator, [response[:mid], response[mid:]])
+
+        records = list(gen.stream("banking_user", count=2))
+        assert len(records) == 2
+        assert records[0]["name"] == sample["name"]
+
+    def test_passes_prompt_to_provider(self, make_generator):
+        gen = self._make_streaming(make_generator, ['{"data": []}'])
+        list(gen.stream("ecommerce_customer", count=3, validate=False))
+
+        prompt = gen.provider.stream.call_args[0][0]
+        assert "3" in prompt
+
+    def test_raises_when_count_less_than_1(self, make_generator):
+        gen = self._make_streaming(make_generator, [])
+        with pytest.raises(ValueError, match="count must be >= 1"):
+            list(gen.stream("ecommerce_customer", count=0))
+
+    def test_raises_for_unknown_context(self, make_generator):
+        gen = self._make_streaming(make_generator, [])
+        with pytest.raises(ValueError, match="Unknown context"):
+            list(gen.stream("nope", count=1))
+
+    def test_raises_on_invalid_record(self, make_generator):
+        gen = self._make_streaming(
+            make_generator, ['{"data": [{"name": "X"}]}']
+        )
+        with pytest.raises(ValidationError) as exc_info:
+            list(gen.stream("banking_user", count=1))
+        assert exc_info.value.invalid_records[0]["record_index"] == 0
+
+    def test_skips_validation_when_disabled(self, make_generator):
+        gen = self._make_streaming(
+            make_generator, ['{"data": [{"name": "X"}]}']
+        )
+        records = list(gen.stream("banking_user", count=1, validate=False))
+        assert records == [{"name": "X"}]
+
+
+class TestGenerateResponseCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_cache(self):
+        from testdata_ai.cache import get_response_cache
+        get_response_cache().clear()
+        yield
+        get_response_cache().clear()
+
+    def _make_deterministic(self, make_generator, response):
+        gen = make_generator(response)
+        gen.config.temperature = 0.0
+        return gen
+
+    def test_identical_requests_hit_cache(self, make_generator):
+        gen = self._make_deterministic(make_generator, '{"data": [{"a": 1}]}')
+        first = gen.generate("ecommerce_customer", count=1, validate=False)
+        second = gen.generate("ecommerce_customer", count=1, validate=False)
+        assert first == second
+        gen.provider.generate.assert_called_once()
+
+    def test_different_counts_do_not_share_entries(self, make_generator):
+        gen = self._make_deterministic(make_generator, '{"data": [{"a": 1}]}')
+        gen.generate("ecommerce_customer", count=1, validate=False)
+        gen.generate("ecommerce_customer", count=2, validate=False)
+        assert gen.provider.generate.call_count == 2
+
+    def test_nonzero_temperature_skips_cache(self, make_generator, monkeypatch):
+        monkeypatch.delenv("TESTDATA_CACHE_NONDETERMINISTIC", raising=False)
+        gen = make_generator('{"data": [{"a": 1}]}')  # temperature=0.7
+        gen.generate("ecommerce_customer", count=1, validate=False)
+        gen.generate("ecommerce_customer", count=1, validate=False)
+        assert gen.provider.generate.call_count == 2
+
+
+class TestGenerateBulk:
+
+    def _make_bulk(self, make_generator, responses):
+        gen = make_generator("{}")
+        gen.provider.submit_batch.return_value = "batch-1"
+        gen.provider.await_batch.return_value = responses
+        return gen
+
+    def test_flattens_batched_responses(self, make_generator):
+        responses = [
+            json.dumps({"data": [{"n": 1}, {"n": 2}]}),
+            json.dumps({"data": [{"n": 3}]}),
+        ]
+        gen = self._make_bulk(make_generator, responses)
+        result = gen.generate_bulk(
+            "ecommerce_customer", count=3, chunk=2, validate=False
+        )
+        assert result == [{"n": 1}, {"n": 2}, {"n": 3}]
+        gen.provider.await_batch.assert_called_once_with("batch-1")
+
+    def test_splits_count_into_chunks(self, make_generator):
+        gen = self._make_bulk(make_generator, [])
+        gen.generate_bulk("ecommerce_customer", count=45, chunk=20, validate=False)
+        prompts = gen.provider.submit_batch.call_args[0][0]
+        assert len(prompts) == 3
+        assert "exactly 5 " in prompts[-1]
+
+    def test_raises_when_count_less_than_1(self, make_generator):
+        gen = self._make_bulk(make_generator, [])
+        with pytest.raises(ValueError, match="count must be >= 1"):
+            gen.generate_bulk("ecommerce_customer", count=0)
+
+    def test_raises_on_validation_failure(self, make_generator):
+        gen = self._make_bulk(
+            make_generator, [json.dumps({"data": [{"name": "X"}]})]
+        )
+        with pytest.raises(ValidationError):
+            gen.generate_bulk("banking_user", count=1)
+
+
+class TestGenerateContexts:
+
+    def test_returns_records_per_context(self, make_generator):
+        response = json.dumps({
+            "ecommerce_customer": [{"n": 1}, {"n": 2}],
+            "banking_user": [{"n": 3}],
+        })
+        gen = make_generator(response)
+        result = gen.generate_contexts(
+            [("ecommerce_customer", 2), ("banking_user", 1)], validate=False
+        )
+        assert result["ecommerce_customer"] == [{"n": 1}, {"n": 2}]
+        assert result["banking_user"] == [{"n": 3}]
+        gen.provider.generate_freeform.assert_called_once()
+
+    def test_raises_for_empty_requests(self, make_generator):
+        gen = make_generator("{}")
+        with pytest.raises(ValueError, match="must not be empty"):
+            gen.generate_contexts([])
+
+    def test_raises_for_duplicate_context(self, make_generator):
+        gen = make_generator("{}")
+        with pytest.raises(ValueError, match="only once"):
+            gen.generate_contexts(
+                [("banking_user", 1), ("banking_user", 2)]
+            )
+
+    def test_raises_when_context_missing_from_response(self, make_generator):
+        gen = make_generator(json.dumps({"ecommerce_customer": []}))
+        with pytest.raises(ValueError, match="missing the 'banking_user' array"):
+            gen.generate_contexts(
+                [("ecommerce_customer", 1), ("banking_user", 1)], validate=False
+            )
+
+    def test_raises_when_response_not_object(self, make_generator):
+        gen = make_generator(json.dumps([1, 2]))
+        with pytest.raises(ValueError, match="not a JSON object"):
+            gen.generate_contexts([("banking_user", 1)])
+
+    def test_warns_on_count_mismatch(self, make_generator, caplog):
+        gen = make_generator(json.dumps({"ecommerce_customer": [{"n": 1}]}))
+        with caplog.at_level(logging.WARNING):
+            gen.generate_contexts([("ecommerce_customer", 3)], validate=False)
+        assert "Requested 3" in caplog.text
+
+    def test_validates_each_context(self, make_generator):
+        gen = make_generator(json.dumps({"banking_user": [{"name": "X"}]}))
+        with pytest.raises(ValidationError):
+            gen.generate_contexts([("banking_user", 1)])
+
+    def test_uses_unforced_generate_variant(self, make_generator):
+        """Multi-context calls must bypass the forced single-array tool.
+
+        Regression test: on Anthropic the forced tool can only emit the
+        {"data": [...]} envelope, which loses the per-context keying.
+        """
+        gen = make_generator(json.dumps({"data": [{"n": 1}]}))
+        gen.provider.generate_freeform.return_value = json.dumps(
+            {"ecommerce_customer": [{"n": 1}]}
+        )
+        result = gen.generate_contexts([("ecommerce_customer", 1)], validate=False)
+        assert result == {"ecommerce_customer": [{"n": 1}]}
+        gen.provider.generate.assert_not_called()
+
+    def test_rejects_data_enveloped_response(self, make_generator):
+        """A {"data": [...]} response has no per-context arrays to read."""
+        gen = make_generator(json.dumps({"data": [{"n": 1}]}))
+        with pytest.raises(ValueError, match="missing the 'ecommerce_customer' array"):
+            gen.generate_contexts([("ecommerce_customer", 1)], validate=False)
+
+
+class TestPrefetch:
+
+    def test_prefetch_resolves_to_records(self, make_generator):
+        records = [{"name": "A"}]
+        gen = make_generator(json.dumps({"data": records}))
+        future = gen.prefetch("ecommerce_customer", count=1, validate=False)
+        assert future.result(timeout=5) == records
+
+    def test_prefetch_reuses_one_pool(self, make_generator):
+        gen = make_generator('{"data": []}')
+        gen.prefetch("ecommerce_customer", count=1, validate=False).result(timeout=5)
+        pool = gen._pool
+        gen.prefetch("ecommerce_customer", count=1, validate=False).result(timeout=5)
+        assert gen._pool is pool
+
+    def test_prefetch_propagates_errors(self, make_generator):
+        gen = make_generator("not json")
+        future = gen.prefetch("ecommerce_customer", count=1)
+        with pytest.raises(ValueError, match="not valid JSON"):
+            future.result(timeout=5)
+
+
+class TestGenerateIter:
+
+    def test_yields_batches_in_request_order(self, make_generator):
+        responses = [json.dumps({"data": [{"n": i}]}) for i in range(3)]
+        gen = make_generator(None)
+        gen.provider.generate.side_effect = responses
+        batches = list(gen.generate_iter(
+            [("ecommerce_customer", 1)] * 3, validate=False
+        ))
+        assert batches == [[{"n": 0}], [{"n": 1}], [{"n": 2}]]
+        assert gen.provider.generate.call_count == 3
+
+    def test_empty_requests_yields_nothing(self, make_generator):
+        gen = make_generator('{"data": []}')
+        assert list(gen.generate_iter([])) == []
+        gen.provider.generate.assert_not_called()
+
+    def test_raises_for_invalid_window(self, make_generator):
+        gen = make_generator('{"data": []}')
+        with pytest.raises(ValueError, match="window must be >= 1"):
+            list(gen.generate_iter([("ecommerce_customer", 1)], window=0))
+
+
+class TestGenerateToFile:
+
+    def _make_streaming(self, make_generator, chunks):
+        gen = make_generator("{}")
+        gen.provider.stream.return_value = iter(chunks)
+        return gen
+
+    def test_writes_ndjson_lines(self, make_generator, tmp_path):
+        records = [{"n": 1}, {"n": 2}, {"n": 3}]
+        gen = self._make_streaming(make_generator, [json.dumps({"data": records})])
+        out = tmp_path / "records.ndjson"
+
+        written = gen.generate_to_file(out, "ecommerce_customer", count=3, validate=False)
+
+        assert written == 3
+        lines = out.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == records
+
+    def test_validation_failure_propagates(self, make_generator, tmp_path):
+        gen = self._make_streaming(
+            make_generator, ['{"data": [{"name": "X"}]}']
+        )
+        with pytest.raises(ValidationError):
+            gen.generate_to_file(tmp_path / "out.ndjson", "banking_user", count=1)
+
+
+class TestGenerateMany:
+
+    def test_splits_total_into_batches(self, make_generator):
+        gen = make_generator(json.dumps({"data": [{"n": 1}] * 5}))
+        result = gen.generate_many(
+            "ecommerce_customer", total=15, batch=5, validate=False
+        )
+        assert len(result) == 15
+        assert gen.provider.generate.call_count == 3
+
+    def test_remainder_batch(self, make_generator):
+        gen = make_generator(json.dumps({"data": [{"n": 1}] * 5}))
+        gen.generate_many("ecommerce_customer", total=12, batch=5, validate=False)
+        # 5 + 5 + 2 -> three API calls
+        assert gen.provider.generate.call_count == 3
+
+    def test_truncates_to_total(self, make_generator):
+        gen = make_generator(json.dumps({"data": [{"n": 1}] * 5}))
+        result = gen.generate_many(
+            "ecommerce_customer", total=7, batch=5, validate=False
+        )
+        assert len(result) == 7
+
+    def test_rejects_invalid_arguments(self, make_generator):
+        gen = make_generator("{}")
+        with pytest.raises(ValueError, match="total must be >= 1"):
+            gen.generate_many("ecommerce_customer", total=0)
+        with pytest.raises(ValueError, match="batch must be >= 1"):
+            gen.generate_many("ecommerce_customer", total=5, batch=0)
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            gen.generate_many("ecommerce_customer", total=5, max_concurrency=0)
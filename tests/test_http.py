@@ -0,0 +1,39 @@
+"""Tests for testdata_ai._http — shared async connection pool."""
+
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from testdata_ai import _http
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_client(monkeypatch):
+    """Isolate each test from the module-level client singleton."""
+    monkeypatch.setattr(_http, "_client", None)
+
+
+class TestGetSharedAsyncClient:
+
+    def test_returns_same_instance(self):
+        fake_client = MagicMock()
+        with patch.object(_http, "_build_client", return_value=fake_client) as mock_build:
+            first = _http.get_shared_async_client()
+            second = _http.get_shared_async_client()
+        assert first is second is fake_client
+        mock_build.assert_called_once()
+
+    def test_build_client_raises_without_httpx(self):
+        with patch.dict("sys.modules", {"httpx": None}):
+            with pytest.raises(ImportError, match="httpx package is required"):
+                _http._build_client()
+
+    def test_build_client_uses_env_limits(self, monkeypatch):
+        monkeypatch.setenv("TESTDATA_MAX_CONN", "50")
+        monkeypatch.setenv("TESTDATA_MAX_KEEPALIVE_CONN", "10")
+        mock_httpx = MagicMock()
+        with patch.dict("sys.modules", {"httpx": mock_httpx}):
+            _http._build_client()
+        mock_httpx.Limits.assert_called_once_with(
+            max_connections=50, max_keepalive_connections=10
+        )
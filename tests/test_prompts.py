@@ -22,17 +22,11 @@ class TestGetPrompt:
         prompt = get_prompt("saas_trial", 1)
         assert '"data"' in prompt
 
-    def test_includes_all_prompt_hints(self):
-        schema = CONTEXTS["ecommerce_customer"]
-        prompt = get_prompt("ecommerce_customer", 2)
-        for hint in schema.prompt_hints:
-            assert hint in prompt
-
-    def test_includes_sample_json(self):
+    def test_omits_static_schema_details(self):
+        """Hints and sample live in the system prompt, not the per-call one."""
         schema = CONTEXTS["banking_user"]
         prompt = get_prompt("banking_user", 1)
-        sample_json = json.dumps(schema.sample, indent=2)
-        assert sample_json in prompt
+        assert json.dumps(schema.sample, indent=2) not in prompt
 
     def test_raises_for_unknown_context(self):
         with pytest.raises(ValueError, match="Unknown context"):
@@ -42,3 +36,67 @@ class TestGetPrompt:
     def test_every_context_produces_nonempty_prompt(self, context_name):
         prompt = get_prompt(context_name, 1)
         assert prompt
+
+
+class TestPromptPartsCache:
+
+    def test_parts_are_cached_per_context(self):
+        from testdata_ai.prompts import _prompt_parts
+        assert _prompt_parts("ecommerce_customer") is _prompt_parts("ecommerce_customer")
+
+    def test_cached_parts_do_not_change_prompt(self):
+        assert get_prompt("banking_user", 7) == get_prompt("banking_user", 7)
+
+    def test_unknown_context_not_cached_as_error(self):
+        from testdata_ai.prompts import _prompt_parts
+        with pytest.raises(ValueError, match="Unknown context"):
+            _prompt_parts("nonexistent_context")
+        with pytest.raises(ValueError, match="Unknown context"):
+            _prompt_parts("nonexistent_context")
+
+
+class TestGetMultiPrompt:
+
+    def test_includes_every_context_and_count(self):
+        from testdata_ai.prompts import get_multi_prompt
+        prompt = get_multi_prompt([("ecommerce_customer", 5), ("banking_user", 3)])
+        assert '"ecommerce_customer", "banking_user"' in prompt
+        assert "exactly 5" in prompt
+        assert "exactly 3" in prompt
+
+    def test_includes_each_sample_structure(self):
+        from testdata_ai.prompts import get_multi_prompt
+        prompt = get_multi_prompt([("ecommerce_customer", 1), ("banking_user", 1)])
+        for context in ("ecommerce_customer", "banking_user"):
+            sample_json = json.dumps(CONTEXTS[context].sample, indent=2)
+            assert sample_json in prompt
+
+    def test_raises_for_unknown_context(self):
+        from testdata_ai.prompts import get_multi_prompt
+        with pytest.raises(ValueError, match="Unknown context"):
+            get_multi_prompt([("ecommerce_customer", 1), ("nope", 1)])
+
+
+class TestGetSystemPrompt:
+
+    def test_includes_all_prompt_hints(self):
+        from testdata_ai.prompts import get_system_prompt
+        schema = CONTEXTS["ecommerce_customer"]
+        system = get_system_prompt("ecommerce_customer")
+        for hint in schema.prompt_hints:
+            assert hint in system
+
+    def test_includes_sample_json(self):
+        from testdata_ai.prompts import get_system_prompt
+        schema = CONTEXTS["banking_user"]
+        system = get_system_prompt("banking_user")
+        assert json.dumps(schema.sample, indent=2) in system
+
+    def test_is_cached_per_context(self):
+        from testdata_ai.prompts import get_system_prompt
+        assert get_system_prompt("saas_trial") is get_system_prompt("saas_trial")
+
+    def test_raises_for_unknown_context(self):
+        from testdata_ai.prompts import get_system_prompt
+        with pytest.raises(ValueError, match="Unknown context"):
+            get_system_prompt("nonexistent_context")
@@ -0,0 +1,78 @@
+"""Tests for testdata_ai._retry — jittered backoff with Retry-After."""
+
+import asyncio
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import pytest
+
+from testdata_ai._retry import call_with_retry
+
+
+def _api_error(status_code, retry_after=None):
+    exc = Exception("api error")
+    exc.status_code = status_code
+    headers = {}
+    if retry_after is not None:
+        headers["retry-after"] = retry_after
+    exc.response = MagicMock()
+    exc.response.headers = headers
+    return exc
+
+
+class TestCallWithRetry:
+
+    def test_returns_result_on_success(self):
+        fn = AsyncMock(return_value="ok")
+        assert asyncio.run(call_with_retry(fn, "a", key="b")) == "ok"
+        fn.assert_awaited_once_with("a", key="b")
+
+    def test_retries_retryable_status_then_succeeds(self):
+        fn = AsyncMock(side_effect=[_api_error(429), "ok"])
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert asyncio.run(call_with_retry(fn)) == "ok"
+        assert fn.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+    def test_non_retryable_status_raises_immediately(self):
+        fn = AsyncMock(side_effect=_api_error(401))
+        with pytest.raises(Exception, match="api error"):
+            asyncio.run(call_with_retry(fn))
+        assert fn.await_count == 1
+
+    def test_exception_without_status_raises_immediately(self):
+        fn = AsyncMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(call_with_retry(fn))
+        assert fn.await_count == 1
+
+    def test_exhausts_max_attempts(self):
+        fn = AsyncMock(side_effect=_api_error(503))
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(Exception, match="api error"):
+                asyncio.run(call_with_retry(fn, max_attempts=3))
+        assert fn.await_count == 3
+
+    def test_honors_retry_after_header(self):
+        fn = AsyncMock(side_effect=[_api_error(429, retry_after="7.5"), "ok"])
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+             patch("testdata_ai._retry.random.uniform", return_value=0.1):
+            asyncio.run(call_with_retry(fn))
+        assert mock_sleep.await_args[0][0] == 7.5
+
+    def test_jitter_wins_when_longer_than_retry_after(self):
+        fn = AsyncMock(side_effect=[_api_error(429, retry_after="0.5"), "ok"])
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+             patch("testdata_ai._retry.random.uniform", return_value=0.9):
+            asyncio.run(call_with_retry(fn))
+        assert mock_sleep.await_args[0][0] == 0.9
+
+    def test_malformed_retry_after_is_ignored(self):
+        fn = AsyncMock(side_effect=[_api_error(429, retry_after="soon"), "ok"])
+        with patch("testdata_ai._retry.asyncio.sleep", new=AsyncMock()), \
+             patch("testdata_ai._retry.random.uniform", return_value=0.1):
+            assert asyncio.run(call_with_retry(fn)) == "ok"
+
+    def test_raises_for_invalid_max_attempts(self):
+        fn = AsyncMock()
+        with pytest.raises(ValueError, match="max_attempts must be >= 1"):
+            asyncio.run(call_with_retry(fn, max_attempts=0))